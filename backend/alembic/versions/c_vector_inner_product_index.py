@@ -0,0 +1,43 @@
+"""Switch vector similarity to inner product on normalized embeddings
+
+Revision ID: c_vector_inner_product_index
+Revises: b_migrate_pinecone_to_pgvector
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c_vector_inner_product_index'
+down_revision: Union[str, None] = 'b_migrate_pinecone_to_pgvector'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - normalize embeddings and index for inner product."""
+    # Ensure stored embeddings are unit-length so inner product equals cosine similarity
+    op.execute('UPDATE vector_embeddings SET embedding = l2_normalize(embedding)')
+    
+    # Replace the cosine HNSW index with an inner product one
+    op.execute('DROP INDEX IF EXISTS vector_embeddings_embedding_idx')
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS vector_embeddings_embedding_idx 
+        ON vector_embeddings 
+        USING hnsw (embedding vector_ip_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the cosine HNSW index."""
+    op.execute('DROP INDEX IF EXISTS vector_embeddings_embedding_idx')
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS vector_embeddings_embedding_idx 
+        ON vector_embeddings 
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
@@ -0,0 +1,50 @@
+"""Store vector embeddings as halfvec
+
+Revision ID: d_vector_embeddings_halfvec
+Revises: c_vector_inner_product_index
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd_vector_embeddings_halfvec'
+down_revision: Union[str, None] = 'c_vector_inner_product_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - convert embeddings to fp16 (requires pgvector 0.7+)."""
+    # The index is tied to the column type, so drop it before converting
+    op.execute('DROP INDEX IF EXISTS vector_embeddings_embedding_idx')
+    op.execute("""
+        ALTER TABLE vector_embeddings 
+        ALTER COLUMN embedding TYPE halfvec(1536) 
+        USING embedding::halfvec(1536)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS vector_embeddings_embedding_idx 
+        ON vector_embeddings 
+        USING hnsw (embedding halfvec_ip_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema - convert embeddings back to fp32."""
+    op.execute('DROP INDEX IF EXISTS vector_embeddings_embedding_idx')
+    op.execute("""
+        ALTER TABLE vector_embeddings 
+        ALTER COLUMN embedding TYPE vector(1536) 
+        USING embedding::vector(1536)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS vector_embeddings_embedding_idx 
+        ON vector_embeddings 
+        USING hnsw (embedding vector_ip_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
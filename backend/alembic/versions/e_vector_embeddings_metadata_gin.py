@@ -0,0 +1,31 @@
+"""Add GIN index on vector_embeddings.metadata
+
+Revision ID: e_vector_embeddings_metadata_gin
+Revises: d_vector_embeddings_halfvec
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e_vector_embeddings_metadata_gin'
+down_revision: Union[str, None] = 'd_vector_embeddings_halfvec'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - index metadata for @> containment filters."""
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_vector_embeddings_metadata 
+        ON vector_embeddings 
+        USING gin (metadata jsonb_path_ops)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop metadata GIN index."""
+    op.execute('DROP INDEX IF EXISTS ix_vector_embeddings_metadata')
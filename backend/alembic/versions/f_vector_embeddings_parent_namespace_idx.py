@@ -0,0 +1,30 @@
+"""Add composite (parent_id, namespace) index on vector_embeddings
+
+Revision ID: f_vector_embeddings_parent_namespace_idx
+Revises: e_vector_embeddings_metadata_gin
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f_vector_embeddings_parent_namespace_idx'
+down_revision: Union[str, None] = 'e_vector_embeddings_metadata_gin'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - replace parent_id index with (parent_id, namespace)."""
+    # The composite index also serves parent_id-only lookups
+    op.create_index('ix_vector_embeddings_parent_id_namespace', 'vector_embeddings', ['parent_id', 'namespace'], unique=False)
+    op.drop_index('ix_vector_embeddings_parent_id', table_name='vector_embeddings')
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore the single-column parent_id index."""
+    op.create_index('ix_vector_embeddings_parent_id', 'vector_embeddings', ['parent_id'], unique=False)
+    op.drop_index('ix_vector_embeddings_parent_id_namespace', table_name='vector_embeddings')
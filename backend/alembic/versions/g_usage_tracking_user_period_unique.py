@@ -0,0 +1,54 @@
+"""Add unique (user_id, period_start) constraint on usage_tracking
+
+Revision ID: g_usage_tracking_user_period_unique
+Revises: f_vector_embeddings_parent_namespace_idx
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'g_usage_tracking_user_period_unique'
+down_revision: Union[str, None] = 'f_vector_embeddings_parent_namespace_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - merge duplicate period rows and enforce uniqueness."""
+    # Fold duplicate rows (from concurrent get-or-create) into the oldest one
+    op.execute("""
+        WITH merged AS (
+            SELECT 
+                MIN(id) AS keep_id,
+                SUM(messages_count) AS messages_count,
+                SUM(tokens_used) AS tokens_used,
+                SUM(api_cost) AS api_cost
+            FROM usage_tracking
+            GROUP BY user_id, period_start
+            HAVING COUNT(*) > 1
+        )
+        UPDATE usage_tracking u
+        SET messages_count = merged.messages_count,
+            tokens_used = merged.tokens_used,
+            api_cost = merged.api_cost
+        FROM merged
+        WHERE u.id = merged.keep_id
+    """)
+    op.execute("""
+        DELETE FROM usage_tracking u
+        USING usage_tracking k
+        WHERE u.user_id = k.user_id
+          AND u.period_start = k.period_start
+          AND u.id > k.id
+    """)
+    
+    op.create_unique_constraint('uq_usage_tracking_user_period', 'usage_tracking', ['user_id', 'period_start'])
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the uniqueness constraint."""
+    op.drop_constraint('uq_usage_tracking_user_period', 'usage_tracking', type_='unique')
@@ -0,0 +1,31 @@
+"""Add HNSW index over binary-quantized vector_embeddings.embedding
+
+Revision ID: h_vector_embeddings_binary_hnsw
+Revises: g_usage_tracking_user_period_unique
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'h_vector_embeddings_binary_hnsw'
+down_revision: Union[str, None] = 'g_usage_tracking_user_period_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Hamming-distance index for the binary prefilter stage."""
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_vector_embeddings_embedding_bin 
+        ON vector_embeddings 
+        USING hnsw ((binary_quantize(embedding)::bit(1536)) bit_hamming_ops)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop binary HNSW index."""
+    op.execute('DROP INDEX IF EXISTS ix_vector_embeddings_embedding_bin')
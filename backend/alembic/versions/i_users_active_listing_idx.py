@@ -0,0 +1,40 @@
+"""Add partial indexes on active users for the admin listing
+
+Revision ID: i_users_active_listing_idx
+Revises: h_vector_embeddings_binary_hnsw
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'i_users_active_listing_idx'
+down_revision: Union[str, None] = 'h_vector_embeddings_binary_hnsw'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - index active users in listing order, with and without a tier filter."""
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_active_tier_created_at 
+            ON users (tier, created_at DESC, id DESC) 
+            WHERE is_active = true
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_active_created_at 
+            ON users (created_at DESC, id DESC) 
+            WHERE is_active = true
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop active-user listing indexes."""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_users_active_created_at')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_users_active_tier_created_at')
@@ -0,0 +1,64 @@
+"""Enforce case-insensitive email uniqueness with a unique lower(email) index
+
+Revision ID: j_users_email_lower_idx
+Revises: i_users_active_listing_idx
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j_users_email_lower_idx'
+down_revision: Union[str, None] = 'i_users_active_listing_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - make lower(email) unique so lookups and sign-ups ignore case."""
+    # Accounts own chats and usage, so case duplicates can't be merged
+    # automatically; they must be resolved by hand before this runs
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT lower(email) AS email, array_agg(id ORDER BY id) AS ids 
+        FROM users 
+        GROUP BY lower(email) 
+        HAVING COUNT(*) > 1
+    """)).all()
+    if duplicates:
+        listed = "; ".join(f"{row.email}: users {list(row.ids)}" for row in duplicates)
+        raise RuntimeError(
+            f"Cannot enforce case-insensitive email uniqueness, "
+            f"resolve these duplicate accounts first: {listed}"
+        )
+    
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        # Left invalid if an earlier concurrent build failed
+        op.execute("""
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_index i 
+                    JOIN pg_class c ON c.oid = i.indexrelid 
+                    WHERE c.relname = 'uq_users_email_lower' AND NOT i.indisvalid
+                ) THEN
+                    DROP INDEX uq_users_email_lower;
+                END IF;
+            END $$
+        """)
+        op.execute("""
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_users_email_lower 
+            ON users (lower(email))
+        """)
+        # Superseded non-unique index from an earlier revision of this migration
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower')
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the lower(email) unique index."""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS uq_users_email_lower')
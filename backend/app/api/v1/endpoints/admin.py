@@ -40,7 +40,7 @@ from app.schemas.logging import (
     LoggingStatsResponse,
 )
 from app.schemas.chat import PersonaTestRequest, PersonaTestResponse
-from app.schemas.auth import UserResponse
+from app.schemas.auth import UserResponse, BulkUserCreateRequest
 from app.services.knowledge_service import KnowledgeService
 from app.services.chat_service import ChatService
 from app.services.user_service import UserService
@@ -289,16 +289,36 @@ async def get_context_types(
 # User Management
 # =============================================================================
 
+# Columns UserResponse needs; the listing skips password hashes and trial fields
+_USER_RESPONSE_COLUMNS = (
+    User.id,
+    User.email,
+    User.username,
+    User.tier,
+    User.is_active,
+    User.is_admin,
+    User.created_at,
+    User.profile_data,
+)
+
+
 @router.get("/users", response_model=List[UserResponse])
 async def list_users(
+    response: Response,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     tier: Optional[str] = None,
     active_only: bool = True,
     db: AsyncSession = Depends(get_db),
     admin: dict = Depends(get_current_admin)
 ):
-    """List all users with optional filtering."""
+    """
+    List all users with optional filtering.
+    
+    Without an offset, pages are fetched by keyset: pass the X-Next-Cursor
+    header from one response as `cursor` to get the next page.
+    """
     user_service = UserService(db)
     
     tier_enum = None
@@ -311,11 +331,50 @@ async def list_users(
                 f"Invalid tier. Valid: {[t.value for t in UserTier]}"
             )
     
-    users = await user_service.list_users(
-        limit=limit,
-        offset=offset,
-        tier=tier_enum,
-        active_only=active_only
+    if offset and not cursor:
+        users = await user_service.list_users(
+            limit=limit,
+            offset=offset,
+            tier=tier_enum,
+            active_only=active_only,
+            columns=_USER_RESPONSE_COLUMNS
+        )
+    else:
+        users, next_cursor = await user_service.list_users_keyset(
+            limit=limit,
+            cursor=cursor,
+            tier=tier_enum,
+            active_only=active_only,
+            columns=_USER_RESPONSE_COLUMNS
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+    
+    return [UserResponse.model_validate(u) for u in users]
+
+
+@router.post("/users/bulk", response_model=List[UserResponse])
+async def bulk_create_users(
+    request: BulkUserCreateRequest,
+    db: AsyncSession = Depends(get_db),
+    admin: dict = Depends(get_current_admin)
+):
+    """Import several users at once (all-or-nothing)."""
+    user_service = UserService(db)
+    
+    tier_enum = UserTier.BASIC
+    if request.tier:
+        try:
+            tier_enum = UserTier(request.tier)
+        except ValueError:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                f"Invalid tier. Valid: {[t.value for t in UserTier]}"
+            )
+    
+    users = await user_service.create_users_bulk(
+        [u.model_dump() for u in request.users],
+        tier=tier_enum
     )
     
     return [UserResponse.model_validate(u) for u in users]
@@ -448,9 +507,10 @@ async def get_system_overview(
     user_service = UserService(db)
     
     # User counts
-    total_users = await user_service.get_user_count(active_only=False)
-    active_users = await user_service.get_user_count(active_only=True)
-    users_by_tier = await user_service.get_users_by_tier()
+    user_stats = await user_service.get_dashboard_stats()
+    total_users = user_stats["total"]
+    active_users = user_stats["active"]
+    users_by_tier = user_stats["by_tier"]
     
     # Message counts
     result = await db.execute(
@@ -8,6 +8,8 @@ Provides:
 - User registration
 - Password reset flow
 """
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -61,7 +63,7 @@ async def login(
     user_service = UserService(db)
     user = await user_service.get_user_by_username(form_data.username)
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await asyncio.to_thread(verify_password, form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -192,7 +194,7 @@ async def change_password(
             detail="User not found"
         )
     
-    if not verify_password(password_data.current_password, user.hashed_password):
+    if not await asyncio.to_thread(verify_password, password_data.current_password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
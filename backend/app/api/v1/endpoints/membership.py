@@ -23,6 +23,7 @@ from app.core.security import get_password_hash
 from app.db.models import UserTier
 import secrets
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -114,10 +115,10 @@ async def receive_webhook(
                 "Invalid webhook signature"
             )
     
-    # Parse payload
+    # Parse payload from the body already read for signature verification
     try:
-        payload = await request.json()
-    except Exception:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
             "Invalid JSON payload"
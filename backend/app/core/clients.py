@@ -3,6 +3,7 @@ Shared API Clients - Centralized client initialization for external services.
 
 This module provides lazy-initialized clients for:
 - OpenAI (GPT-4, Embeddings)
+- Redis (async, for caching on the request path)
 
 Using centralized clients ensures:
 - Single source of truth for configuration
@@ -11,11 +12,13 @@ Using centralized clients ensures:
 """
 from typing import Optional
 from openai import AsyncOpenAI
+from redis.asyncio import Redis
 
 from app.core.config import settings
 
 # Singleton instances
 _openai_client: Optional[AsyncOpenAI] = None
+_redis_client: Optional[Redis] = None
 
 
 def get_openai_client() -> AsyncOpenAI:
@@ -31,7 +34,23 @@ def get_openai_client() -> AsyncOpenAI:
     return _openai_client
 
 
+def get_redis_client() -> Redis:
+    """
+    Get or create the async Redis client.
+    
+    Responses are returned as bytes so binary values can be cached.
+    
+    Returns:
+        Async Redis client instance
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = Redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
 def reset_clients():
     """Reset all clients. Useful for testing."""
-    global _openai_client
+    global _openai_client, _redis_client
     _openai_client = None
+    _redis_client = None
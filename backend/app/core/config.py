@@ -56,6 +56,10 @@ class Settings(BaseSettings):
         "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
     )
     
+    # RAG - two-stage search: Hamming-distance candidates over binary-quantized
+    # embeddings, reranked at full precision (for large corpora)
+    RAG_BINARY_PREFILTER: bool = os.getenv("RAG_BINARY_PREFILTER", "false").lower() == "true"
+    
     # Usage Limits
     BASIC_MEMBER_MESSAGES_PER_MONTH: int = int(
         os.getenv("BASIC_MEMBER_MESSAGES_PER_MONTH", "50")
@@ -27,12 +27,37 @@ RAG_SCORE_THRESHOLD = 0.7
 RAG_CHUNK_SIZE = 500
 RAG_CHUNK_OVERLAP = 50
 
+# Inputs per OpenAI embeddings request (API maximum is 2048)
+EMBEDDING_BATCH_SIZE = 256
+# Embedding requests in flight at once per indexing call
+EMBEDDING_MAX_CONCURRENCY = 4
+
+# Retrieval results kept in the per-process context cache
+RAG_CONTEXT_CACHE_SIZE = 1000
+# Redis counter bumped on every index change; part of each context cache key,
+# so every worker stops serving results retrieved before the change
+RAG_CONTEXT_GENERATION_KEY = "rag:context:gen"
+
+# HNSW candidate list size (pgvector default); raised per query when top_k is larger
+HNSW_EF_SEARCH = 40
+# Largest ef_search pgvector accepts; filtered searches use it when the
+# installed pgvector (< 0.8) has no iterative scans
+HNSW_EF_SEARCH_MAX = 1000
+
+# Binary-prefilter candidates fetched per requested result before reranking
+RAG_RERANK_CANDIDATE_FACTOR = 10
+
+# Prepared statements asyncpg keeps per connection (SQLAlchemy default is 100)
+DB_STATEMENT_CACHE_SIZE = 500
+
 # =============================================================================
 # Pagination Defaults
 # =============================================================================
 
 DEFAULT_PAGE_LIMIT = 50
 MAX_PAGE_LIMIT = 500
+# Rows fetched per round-trip when streaming large listings
+STREAM_BATCH_SIZE = 1000
 DEFAULT_PAGE_OFFSET = 0
 
 # Chat history pagination
@@ -51,6 +76,19 @@ CACHE_TTL_DAY = 86400  # 24 hours
 # Usage cache TTL
 USAGE_CACHE_TTL = 3600  # 1 hour
 
+# Per-process user lookup cache; the short TTL bounds staleness across workers
+USER_CACHE_SIZE = 10_000
+USER_CACHE_TTL = 60  # 1 minute
+
+# Shared (Redis) cache of the auth user row; writes delete it and notify
+# every worker on USER_INVALIDATE_CHANNEL
+USER_REDIS_CACHE_TTL = 600  # 10 minutes
+USER_INVALIDATE_CHANNEL = "user-invalidate"
+# Attempts at the post-write invalidation before the failure is logged
+USER_INVALIDATE_ATTEMPTS = 3
+# Longest wait between reconnects of the invalidation listener
+USER_INVALIDATE_MAX_BACKOFF = 30  # seconds
+
 # =============================================================================
 # Rate Limiting Defaults
 # =============================================================================
@@ -114,6 +152,8 @@ BATCH_SIZE = 100
 # Password requirements
 MIN_PASSWORD_LENGTH = 8
 MAX_PASSWORD_LENGTH = 128
+# bcrypt hashes run at once per bulk import (each holds an executor thread)
+PASSWORD_HASH_MAX_CONCURRENCY = 4
 
 # Token expiration (in minutes/days)
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
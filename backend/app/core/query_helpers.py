@@ -3,7 +3,9 @@ Database Query Helpers
 
 Common query patterns and optimizations to reduce duplication.
 """
-from typing import Optional, TypeVar, Type, List
+import base64
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple, TypeVar, Type, List
 from sqlalchemy import select, func, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
@@ -17,10 +19,16 @@ ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 class QueryBuilder:
     """Helper class for building optimized database queries."""
     
-    def __init__(self, model: Type[ModelType], db: AsyncSession):
+    def __init__(
+        self,
+        model: Type[ModelType],
+        db: AsyncSession,
+        columns: Optional[Sequence[Any]] = None
+    ):
         self.model = model
         self.db = db
-        self._query = select(model)
+        # Selecting only the needed columns avoids loading wide rows
+        self._query = select(*columns) if columns else select(model)
     
     def filter_by(self, **filters) -> "QueryBuilder":
         """Add WHERE clauses to query."""
@@ -64,8 +72,9 @@ async def get_paginated_results(
     offset: Optional[int] = None,
     filters: Optional[dict] = None,
     order_by: Optional[str] = None,
-    descending: bool = True
-) -> List[ModelType]:
+    descending: bool = True,
+    columns: Optional[Sequence[Any]] = None
+) -> List[Any]:
     """
     Get paginated results with common patterns.
     
@@ -77,11 +86,12 @@ async def get_paginated_results(
         filters: Dictionary of field:value filters
         order_by: Field to order by
         descending: Order direction
+        columns: Select only these model columns
     
     Returns:
-        List of model instances
+        List of model instances, or Row tuples when columns are given
     """
-    builder = QueryBuilder(model, db)
+    builder = QueryBuilder(model, db, columns)
     
     if filters:
         builder.filter_by(**filters)
@@ -92,6 +102,8 @@ async def get_paginated_results(
     builder.paginate(limit, offset)
     
     result = await db.execute(builder.build())
+    if columns:
+        return list(result.all())
     return list(result.scalars().all())
 
 
@@ -120,3 +132,22 @@ async def count_records(
     
     result = await db.execute(query)
     return result.scalar() or 0
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Encode a keyset pagination position as an opaque URL-safe cursor."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(id)
+    except (UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
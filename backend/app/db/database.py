@@ -1,17 +1,39 @@
 """
 Database configuration and session management
 """
+import logging
+
+import orjson
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from app.core.constants import DB_STATEMENT_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
 
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
     echo=settings.DEBUG,
     future=True,
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+    connect_args={"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE},
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _register_vector_codecs(dbapi_connection, connection_record):
+    """Register pgvector binary codecs so embeddings bind without text conversion."""
+    try:
+        dbapi_connection.run_async(register_vector)
+    except ValueError as e:
+        # Extension not installed yet; only vector queries fail on this connection
+        logger.warning(f"pgvector codecs not registered: {e}")
+
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -37,4 +59,7 @@ async def get_db() -> AsyncSession:
 async def init_db():
     """Initialize database (create tables)"""
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         await conn.run_sync(Base.metadata.create_all)
+    # Connections opened before the extension existed lack the vector codecs
+    await engine.dispose()
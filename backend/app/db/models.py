@@ -1,7 +1,7 @@
 """
 Database models
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Enum as SQLEnum, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Enum as SQLEnum, JSON, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
@@ -42,6 +42,26 @@ class User(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Fetch server-generated columns (updated_at) via RETURNING on flush, so
+    # they are readable after commit without a refresh
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        # Emails are unique ignoring case; also serves case-insensitive lookups
+        Index("uq_users_email_lower", func.lower(email), unique=True),
+        # Admin listing of active users in created_at order, with and without a tier filter
+        Index(
+            "ix_users_active_tier_created_at",
+            tier, created_at.desc(), id.desc(),
+            postgresql_where=(is_active == True),
+        ),
+        Index(
+            "ix_users_active_created_at",
+            created_at.desc(), id.desc(),
+            postgresql_where=(is_active == True),
+        ),
+    )
 
 
 class ChatMessage(Base):
@@ -68,6 +88,11 @@ class UsageTracking(Base):
     tokens_used = Column(Integer, default=0)
     api_cost = Column(Integer, default=0)  # Cost in micro-dollars (1/1,000,000 USD) for precision
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # One row per user per period (target of the usage upsert)
+        UniqueConstraint("user_id", "period_start", name="uq_usage_tracking_user_period"),
+    )
 
 
 class KnowledgeBase(Base):
@@ -84,6 +109,9 @@ class KnowledgeBase(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Load updated_at via RETURNING on flush, readable after commit without a refresh
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class VectorEmbedding(Base):
@@ -92,14 +120,18 @@ class VectorEmbedding(Base):
     
     id = Column(String, primary_key=True)  # Vector ID (e.g., "kb_001_chunk_0")
     knowledge_base_id = Column(Integer, nullable=True, index=True)
-    # Note: embedding column is defined as vector(1536) in database, but SQLAlchemy doesn't have native support
+    # Note: embedding column is defined as halfvec(1536) in database, but SQLAlchemy doesn't have native support
     # We'll handle it via raw SQL queries
     content = Column(Text, nullable=False)
-    metadata = Column(JSON, nullable=True)
+    metadata_ = Column("metadata", JSON, nullable=True)  # Column stays 'metadata'; the attribute name is reserved
     namespace = Column(String, nullable=True, index=True)
     chunk_index = Column(Integer, nullable=True)
-    parent_id = Column(String, nullable=True, index=True)
+    parent_id = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index("ix_vector_embeddings_parent_id_namespace", "parent_id", "namespace"),
+    )
 
 
 class MissingKBItem(Base):
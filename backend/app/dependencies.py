@@ -55,7 +55,7 @@ async def get_current_user(
         )
     
     user_service = UserService(db)
-    user = await user_service.get_user_by_id(user_id)
+    user = await user_service.get_user_by_id_fast(user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -103,7 +103,7 @@ async def get_optional_user(
         return None
     
     user_service = UserService(db)
-    user = await user_service.get_user_by_id(user_id)
+    user = await user_service.get_user_by_id_fast(user_id)
     
     if user is None or not user.is_active:
         return None
@@ -8,6 +8,7 @@ Configures and starts the FastAPI application with:
 - Database initialization on startup
 - Health check endpoints
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -22,6 +23,7 @@ from app.core.config import settings
 from app.core.exceptions import TayAIError, to_http_exception
 from app.api.v1.router import api_router
 from app.db.database import init_db
+from app.services.user_service import listen_for_user_invalidations
 from app.middleware import RateLimitMiddleware
 
 # Configure logging
@@ -43,9 +45,11 @@ async def lifespan(app: FastAPI):
     logger.info("Starting TayAI API...")
     await init_db()
     logger.info("Database initialized")
+    user_invalidations = asyncio.create_task(listen_for_user_invalidations())
     yield
     # Shutdown
     logger.info("Shutting down TayAI API...")
+    user_invalidations.cancel()
 
 
 # =============================================================================
@@ -130,7 +134,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["X-RateLimit-Limit", "X-RateLimit-Remaining", "Retry-After"],
+    expose_headers=["X-RateLimit-Limit", "X-RateLimit-Remaining", "Retry-After", "X-Next-Cursor"],
 )
 
 # Rate Limit Middleware
@@ -4,7 +4,7 @@ Authentication Schemas
 Defines request/response schemas for authentication endpoints.
 """
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -51,6 +51,12 @@ class UserCreate(BaseModel):
     password: str = Field(min_length=8)
 
 
+class BulkUserCreateRequest(BaseModel):
+    """Admin request to import several users at once."""
+    users: List[UserCreate] = Field(..., min_length=1, max_length=500)
+    tier: Optional[str] = None  # Defaults to basic (with trial)
+
+
 class UserResponse(BaseModel):
     """User response schema (excludes sensitive data)."""
     id: int
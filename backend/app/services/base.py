@@ -175,16 +175,23 @@ class BaseService(Generic[ModelType]):
         self.logger.info(f"Created {self.model.__name__} with id {instance.id}")
         return instance
     
-    async def update(self, id: int, **data) -> Optional[ModelType]:
+    async def update(self, id: int, refresh: bool = False, **data) -> Optional[ModelType]:
         """
         Update a record by ID.
         
         Args:
             id: Primary key value
+            refresh: Reload the whole row after commit
             **data: Fields to update
             
         Returns:
             Updated model instance or None
+        
+        Without refresh, server-generated columns (e.g. an onupdate
+        updated_at) are expired after the flush, and reading them in async
+        code raises MissingGreenlet, unless the model maps them with
+        eager_defaults (as User and KnowledgeBase do) so the UPDATE
+        returns them. Pass refresh=True to read them on other models.
         """
         instance = await self.get_by_id(id)
         if not instance:
@@ -195,7 +202,10 @@ class BaseService(Generic[ModelType]):
                 setattr(instance, field, value)
         
         await self.db.commit()
-        await self.db.refresh(instance)
+        # Sessions don't expire on commit, so the instance already holds
+        # the values just set
+        if refresh:
+            await self.db.refresh(instance)
         
         self.logger.info(f"Updated {self.model.__name__} with id {id}")
         return instance
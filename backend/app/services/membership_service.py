@@ -8,16 +8,30 @@ Supports:
 - User tier synchronization
 - Platform-specific API communication
 """
+import hashlib
+import hmac
 import logging
+import re
 import httpx
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Mapping
 from enum import Enum
+from types import MappingProxyType
 
 from app.core.config import settings
 from app.db.models import UserTier
 
 logger = logging.getLogger(__name__)
 
+# Valid characters of a hex-encoded SHA-256 signature
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Keywords in a product identifier that indicate the VIP (Elite) tier
+_VIP_KEYWORD_RE = re.compile(r"vip|elite")
+
+# Shared read-only fallback for missing nested webhook objects
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 class MembershipPlatform(str, Enum):
     """Supported membership platforms."""
@@ -55,6 +69,17 @@ TIER_MAPPINGS: Dict[str, Dict[str, UserTier]] = {
 }
 
 
+@lru_cache(maxsize=8)
+def _get_hmac_template(key: bytes) -> hmac.HMAC:
+    """
+    Get a keyed HMAC-SHA256 object shared across service instances.
+    
+    Callers must .copy() it before updating, so the key schedule is
+    computed once per secret rather than once per webhook.
+    """
+    return hmac.new(key, digestmod=hashlib.sha256)
+
+
 class MembershipService:
     """
     Service for membership platform integration.
@@ -71,7 +96,10 @@ class MembershipService:
             self.api_key = settings.SKOOL_WEBHOOK_SECRET
         else:
             self.api_key = settings.MEMBERSHIP_PLATFORM_API_KEY
+        self._api_key_bytes = self.api_key.encode() if self.api_key else b""
+        self._hmac_template = _get_hmac_template(self._api_key_bytes)
         self.tier_mapping = TIER_MAPPINGS.get(platform.value, TIER_MAPPINGS["custom"])
+        self._tier_items = tuple(self.tier_mapping.items())
     
     # =========================================================================
     # Webhook Processing
@@ -83,25 +111,26 @@ class MembershipService:
         
         Args:
             payload: Raw request body
-            signature: Signature header from request
+            signature: Signature header from request (optionally "sha256=" prefixed)
             
         Returns:
             True if signature is valid
         """
-        import hmac
-        import hashlib
-        
         if not self.api_key:
             logger.warning("No API key configured for webhook verification")
             return True  # Allow in development
         
-        expected = hmac.new(
-            self.api_key.encode(),
-            payload,
-            hashlib.sha256
-        ).hexdigest()
+        # Reject structurally invalid signatures before hashing the payload
+        signature = signature.removeprefix("sha256=")
+        if len(signature) != 64 or not all(c in _HEX_DIGITS for c in signature):
+            return False
+        
+        # Compare raw digests rather than hex strings
+        hasher = self._hmac_template.copy()
+        hasher.update(payload)
+        expected = hasher.digest()
         
-        return hmac.compare_digest(expected, signature)
+        return hmac.compare_digest(expected, bytes.fromhex(signature))
     
     def parse_webhook_event(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -138,9 +167,9 @@ class MembershipService:
         """
         # Handle Zapier format (most common for Skool)
         if "data" in data:
-            zapier_data = data.get("data", {})
-            member = zapier_data.get("member", {}) or zapier_data.get("user", {})
-            group = zapier_data.get("group", {}) or zapier_data.get("community", {})
+            zapier_data = data.get("data") or _EMPTY
+            member = zapier_data.get("member") or zapier_data.get("user") or _EMPTY
+            group = zapier_data.get("group") or zapier_data.get("community") or _EMPTY
             
             event_type = data.get("event", "")
             event_mapping = {
@@ -169,8 +198,8 @@ class MembershipService:
             }
         
         # Handle direct Skool webhook format
-        member = data.get("member", {}) or data.get("user", {})
-        group = data.get("group", {}) or data.get("community", {})
+        member = data.get("member") or data.get("user") or _EMPTY
+        group = data.get("group") or data.get("community") or _EMPTY
         
         event_type = data.get("event", data.get("event_type", ""))
         event_mapping = {
@@ -229,19 +258,14 @@ class MembershipService:
             return self.tier_mapping[product_lower]
         
         # Try partial match
-        for key, tier in self.tier_mapping.items():
+        for key, tier in self._tier_items:
             if key in product_lower or product_lower in key:
                 return tier
         
-        # Check for tier keywords
-        if "vip" in product_lower or "elite" in product_lower:
-            return UserTier.VIP
-        
+        # Check for tier keywords in a single scan
         # Skool-specific: Hair Hu$tlers Co = Basic, Hair Hu$tlers ELITE = VIP
-        if "hair_hustlers" in product_lower:
-            if "elite" in product_lower:
-                return UserTier.VIP
-            return UserTier.BASIC
+        if _VIP_KEYWORD_RE.search(product_lower):
+            return UserTier.VIP
         
         # Default to basic (trial)
         return UserTier.BASIC
@@ -310,7 +334,6 @@ class MembershipService:
             ]
             if tiers:
                 # Return highest tier (VIP > BASIC)
-                tier_order = {UserTier.VIP: 2, UserTier.BASIC: 1}
-                return max(tiers, key=lambda t: tier_order.get(t, 0))
+                return UserTier.VIP if UserTier.VIP in tiers else UserTier.BASIC
         
         return UserTier.BASIC
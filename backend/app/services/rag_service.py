@@ -6,18 +6,36 @@ Handles the core RAG pipeline:
 2. Vector storage in PostgreSQL with pgvector
 3. Semantic search and context retrieval
 """
+import asyncio
+import hashlib
+import math
 import re
 import logging
 from typing import List, Dict, Tuple, Optional, Union
-from dataclasses import dataclass, field
-import json
+from array import array
+from dataclasses import dataclass
+
+import orjson
+from cachetools import TTLCache
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text, select, delete
 from sqlalchemy.dialects.postgresql import JSONB
 
 from app.core.config import settings
-from app.core.clients import get_openai_client
+from app.core.clients import get_openai_client, get_redis_client
+from app.core.constants import (
+    CACHE_TTL_DAY,
+    CACHE_TTL_SHORT,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_CONCURRENCY,
+    HNSW_EF_SEARCH,
+    HNSW_EF_SEARCH_MAX,
+    RAG_CONTEXT_CACHE_SIZE,
+    RAG_CONTEXT_GENERATION_KEY,
+    RAG_RERANK_CANDIDATE_FACTOR,
+)
+from app.core.performance import batch_process
 from app.db.models import VectorEmbedding
 
 logger = logging.getLogger(__name__)
@@ -27,16 +45,79 @@ logger = logging.getLogger(__name__)
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChunkConfig:
-    """Configuration for content chunking."""
+    """Configuration for content chunking (immutable, safe to share)."""
     chunk_size: int = 500
     chunk_overlap: int = 50
     min_chunk_size: int = 100
-    separators: List[str] = field(default_factory=lambda: ["\n\n", "\n", ". "])
+    separators: Tuple[str, ...] = ("\n\n", "\n", ". ")
+
+
+DEFAULT_CHUNK_CONFIG = ChunkConfig()
+
+# Recent retrieval results shared across RAGService instances (one per
+# request). Keys include the shared index generation (RAG_CONTEXT_GENERATION_KEY),
+# which every index change bumps, so no worker serves results retrieved before it
+_context_cache: TTLCache = TTLCache(maxsize=RAG_CONTEXT_CACHE_SIZE, ttl=CACHE_TTL_SHORT)
+
+# Whether the installed pgvector (0.8+) supports iterative HNSW scans;
+# looked up on the first filtered search
+_iterative_scan_supported: Optional[bool] = None
+
+# Chunking patterns, compiled once at import
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\n+')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Nearest-neighbour queries. The SQL text is constant so asyncpg can reuse
+# one prepared statement for every call; unset filters bind NULL and drop
+# out. The inner ORDER BY distance + LIMIT is the shape pgvector serves from
+# the HNSW index; the outer query filters on the distance computed there.
+# Embeddings are unit-length, so the negative inner product (<#>) ranks
+# identically to cosine distance without normalizing per row. The namespace
+# and metadata filters apply to the candidates the index returns, so filtered
+# searches run an iterative scan (see _prepare_hnsw_scan); its relaxed order
+# is why the outer query sorts again.
+_NEAREST_FILTERS = """
+    WHERE (CAST(:namespace AS varchar) IS NULL OR namespace = CAST(:namespace AS varchar))
+      AND (CAST(:metadata_filter AS jsonb) IS NULL OR metadata @> CAST(:metadata_filter AS jsonb))
+"""
 
+# With RAG_BINARY_PREFILTER the HNSW index over binary_quantize(embedding)
+# picks candidates by Hamming distance (<~>), which are then reranked by the
+# full-precision inner product
+_BINARY_CANDIDATES = f"""(
+        SELECT id, content, metadata, embedding
+        FROM vector_embeddings
+        {_NEAREST_FILTERS}
+        ORDER BY CAST(binary_quantize(embedding) AS bit(1536))
+                 <~> binary_quantize(CAST(:query_vector AS halfvec))
+        LIMIT :candidates
+    ) AS candidates"""
 
-@dataclass
+
+def _nearest_sql(columns: str, outer_filter: str):
+    """Build a nearest-neighbour query returning columns plus similarity."""
+    source = _BINARY_CANDIDATES if settings.RAG_BINARY_PREFILTER else f"vector_embeddings {_NEAREST_FILTERS}"
+    return text(f"""
+        SELECT {columns}, -distance AS similarity
+        FROM (
+            SELECT {columns},
+                   embedding <#> CAST(:query_vector AS halfvec) AS distance
+            FROM {source}
+            ORDER BY distance
+            LIMIT :top_k
+        ) AS nearest
+        WHERE {outer_filter}
+        ORDER BY distance
+    """)
+
+
+_RETRIEVE_CONTEXT_SQL = _nearest_sql("id, content, metadata", "-distance >= :threshold")
+_SEARCH_SIMILAR_SQL = _nearest_sql("id, metadata", "distance < 0")
+
+
+@dataclass(slots=True)
 class RetrievalResult:
     """Single result from context retrieval."""
     content: str
@@ -45,7 +126,7 @@ class RetrievalResult:
     chunk_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextResult:
     """Complete context retrieval result with sources."""
     context: str
@@ -68,7 +149,7 @@ class RAGService:
     
     def __init__(self, db: Optional[AsyncSession] = None, chunk_config: Optional[ChunkConfig] = None):
         self.db = db
-        self.chunk_config = chunk_config or ChunkConfig()
+        self.chunk_config = chunk_config or DEFAULT_CHUNK_CONFIG
         self.embedding_model = settings.OPENAI_EMBEDDING_MODEL
         self.embedding_dimension = 1536  # text-embedding-3-small dimension
     
@@ -103,69 +184,44 @@ class RAGService:
             logger.error("Database session not provided")
             return ContextResult("", [], 0, 0.0) if include_sources else ""
         
+        # Without the generation a cached result can't be trusted; skip the cache
+        generation = await self._context_generation()
+        cache_key = None
+        if generation is not None:
+            cache_key = (generation, *self._context_cache_key(
+                query, top_k, score_threshold, filter_metadata, namespace
+            ))
+            cached = _context_cache.get(cache_key)
+            if cached is not None:
+                return cached if include_sources else cached.context
+        
         try:
             embedding = await self._generate_embedding(query)
             
-            # Build SQL query for vector similarity search
-            # Using cosine distance (1 - cosine similarity)
-            # Lower distance = higher similarity
-            # Convert embedding list to PostgreSQL vector format string
-            embedding_str = "[" + ",".join(map(str, embedding)) + "]"
+            # The embedding list is sent in pgvector's binary format (codec
+            # registered on connect) and stored as halfvec
+            params = self._nearest_params(embedding, top_k, filter_metadata, namespace)
+            params["threshold"] = score_threshold
             
-            query_sql = """
-                SELECT 
-                    id,
-                    content,
-                    metadata,
-                    1 - (embedding <=> :query_vector::vector) as similarity
-                FROM vector_embeddings
-                WHERE 1 - (embedding <=> :query_vector::vector) >= :threshold
-            """
-            
-            params = {
-                "query_vector": embedding_str,
-                "threshold": score_threshold
-            }
-            
-            # Add namespace filter if provided
-            if namespace:
-                query_sql += " AND namespace = :namespace"
-                params["namespace"] = namespace
-            
-            # Add metadata filters if provided
-            if filter_metadata:
-                for key, value in filter_metadata.items():
-                    # Use JSONB operators for metadata filtering
-                    if isinstance(value, (dict, list)):
-                        query_sql += f" AND metadata->>:key_{key} = :value_{key}::jsonb"
-                        params[f"key_{key}"] = key
-                        params[f"value_{key}"] = json.dumps(value)
-                    else:
-                        query_sql += f" AND metadata->>:key_{key} = :value_{key}"
-                        params[f"key_{key}"] = key
-                        params[f"value_{key}"] = str(value)
-            
-            query_sql += " ORDER BY similarity DESC LIMIT :top_k"
-            params["top_k"] = top_k
-            
-            result = await self.db.execute(text(query_sql), params)
+            await self._prepare_hnsw_scan(params)
+            result = await self.db.execute(_RETRIEVE_CONTEXT_SQL, params)
             rows = result.fetchall()
             
             # Convert to RetrievalResult objects
-            matches = []
-            for row in rows:
-                metadata = row.metadata if isinstance(row.metadata, dict) else json.loads(row.metadata) if row.metadata else {}
-                matches.append(
-                    RetrievalResult(
-                        content=row.content,
-                        score=float(row.similarity),
-                        metadata=metadata,
-                        chunk_id=row.id
-                    )
+            matches = [
+                RetrievalResult(
+                    content=row.content,
+                    score=float(row.similarity),
+                    metadata=row.metadata or {},
+                    chunk_id=row.id
                 )
+                for row in rows
+            ]
             
             if not matches:
                 logger.info(f"No results above {score_threshold} for: {query[:50]}...")
+                if cache_key is not None:
+                    _context_cache[cache_key] = ContextResult("", [], 0, 0.0)
                 return ContextResult("", [], 0, 0.0) if include_sources else ""
             
             # Format context
@@ -183,14 +239,46 @@ class RAGService:
                 for m in matches
             ]
             
+            context_result = ContextResult(context, sources, len(matches), round(avg_score, 3))
+            if cache_key is not None:
+                _context_cache[cache_key] = context_result
+            
             if include_sources:
-                return ContextResult(context, sources, len(matches), round(avg_score, 3))
+                return context_result
             return context
             
         except Exception as e:
             logger.error(f"Error retrieving context: {e}")
             return ContextResult("", [], 0, 0.0) if include_sources else ""
     
+    async def _context_generation(self) -> Optional[int]:
+        """Current index generation from Redis, or None if it can't be read."""
+        try:
+            return int(await get_redis_client().get(RAG_CONTEXT_GENERATION_KEY) or 0)
+        except Exception as e:
+            logger.warning(f"Context cache generation read error: {e}")
+            return None
+    
+    async def _invalidate_context_cache(self) -> None:
+        """Drop cached retrieval results in every worker after indexed content changes."""
+        _context_cache.clear()
+        try:
+            await get_redis_client().incr(RAG_CONTEXT_GENERATION_KEY)
+        except Exception as e:
+            logger.warning(f"Context cache invalidation error: {e}")
+    
+    @staticmethod
+    def _context_cache_key(
+        query: str,
+        top_k: int,
+        score_threshold: float,
+        filter_metadata: Optional[Dict],
+        namespace: Optional[str]
+    ) -> Tuple:
+        """Build the retrieval cache key; queries differing only in case/whitespace share it."""
+        filter_key = orjson.dumps(filter_metadata, option=orjson.OPT_SORT_KEYS) if filter_metadata else None
+        return (" ".join(query.lower().split()), top_k, score_threshold, filter_key, namespace)
+    
     def _format_context(self, result: RetrievalResult) -> str:
         """Format a single context piece."""
         title = result.metadata.get("title", "")
@@ -205,25 +293,128 @@ class RAGService:
         
         return f"{header}{result.content}"
     
+    @staticmethod
+    def _nearest_params(
+        embedding: List[float],
+        top_k: int,
+        filter_metadata: Optional[Dict],
+        namespace: Optional[str]
+    ) -> Dict:
+        """Bind parameters for the nearest-neighbour queries; unset filters bind NULL."""
+        params = {
+            "query_vector": embedding,
+            "top_k": top_k,
+            "namespace": namespace or None,
+            # Single JSONB containment predicate the GIN index on metadata can serve
+            "metadata_filter": orjson.dumps(filter_metadata).decode() if filter_metadata else None,
+        }
+        if settings.RAG_BINARY_PREFILTER:
+            params["candidates"] = top_k * RAG_RERANK_CANDIDATE_FACTOR
+        return params
+    
+    async def _prepare_hnsw_scan(self, params: Dict) -> None:
+        """
+        Set this transaction's HNSW options for a nearest-neighbour query.
+        
+        The index yields at most ef_search candidates, so ef_search is raised
+        to the query's LIMIT. Namespace/metadata filters run after the index,
+        so filtered queries also enable iterative scans, which keep searching
+        until enough rows pass; without them (pgvector < 0.8) ef_search is
+        raised to its maximum instead.
+        
+        Args:
+            params: Bind parameters from _nearest_params
+        """
+        limit = params.get("candidates", params["top_k"])
+        filtered = params["namespace"] is not None or params["metadata_filter"] is not None
+        iterative = filtered and await self._supports_iterative_scan()
+        if filtered and not iterative:
+            limit = HNSW_EF_SEARCH_MAX
+        ef_search = min(limit, HNSW_EF_SEARCH_MAX)
+        
+        if iterative:
+            await self.db.execute(
+                text(
+                    "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+                    "set_config('hnsw.iterative_scan', 'relaxed_order', true)"
+                ),
+                {"ef_search": str(max(ef_search, HNSW_EF_SEARCH))}
+            )
+        elif ef_search > HNSW_EF_SEARCH:
+            await self.db.execute(
+                text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+                {"ef_search": str(ef_search)}
+            )
+    
+    async def _supports_iterative_scan(self) -> bool:
+        """Check (once per process) whether pgvector supports hnsw.iterative_scan."""
+        global _iterative_scan_supported
+        if _iterative_scan_supported is None:
+            result = await self.db.execute(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            )
+            version = result.scalar() or "0"
+            major_minor = tuple(int(part) for part in version.split(".")[:2])
+            _iterative_scan_supported = major_minor >= (0, 8)
+        return _iterative_scan_supported
+    
     # -------------------------------------------------------------------------
     # Embedding Generation
     # -------------------------------------------------------------------------
     
+    @staticmethod
+    def _normalize(embedding: List[float]) -> List[float]:
+        """Scale an embedding to unit length so inner product equals cosine similarity."""
+        norm = math.hypot(*embedding)
+        if not norm:
+            return embedding
+        return [x / norm for x in embedding]
+    
     async def _generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding vector for text."""
+        """
+        Generate a unit-length embedding vector for text.
+        
+        Embeddings are cached in Redis as packed float32 keyed by a hash
+        of the text, so repeated queries skip the OpenAI round-trip.
+        """
+        cache_key = f"emb:{self.embedding_model}:{hashlib.sha256(text.encode()).hexdigest()}"
+        try:
+            cached = await get_redis_client().get(cache_key)
+            if cached:
+                return array("f", cached).tolist()
+        except Exception as e:
+            logger.warning(f"Embedding cache read error: {e}")
+        
         response = await get_openai_client().embeddings.create(
             model=self.embedding_model,
             input=text
         )
-        return response.data[0].embedding
+        embedding = self._normalize(response.data[0].embedding)
+        
+        try:
+            await get_redis_client().setex(cache_key, CACHE_TTL_DAY, array("f", embedding).tobytes())
+        except Exception as e:
+            logger.warning(f"Embedding cache write error: {e}")
+        
+        return embedding
     
     async def _generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts in batch."""
-        response = await get_openai_client().embeddings.create(
-            model=self.embedding_model,
-            input=texts
+        """Generate embeddings for multiple texts, sending batches concurrently."""
+        semaphore = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
+        
+        async def embed(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                response = await get_openai_client().embeddings.create(
+                    model=self.embedding_model,
+                    input=batch
+                )
+            return [self._normalize(item.embedding) for item in response.data]
+        
+        # gather preserves batch order, so results line up with texts
+        results = await asyncio.gather(
+            *(embed(batch) for batch in batch_process(texts, EMBEDDING_BATCH_SIZE))
         )
-        return [item.embedding for item in response.data]
+        return [embedding for batch in results for embedding in batch]
     
     # -------------------------------------------------------------------------
     # Content Indexing
@@ -270,9 +461,10 @@ class RAGService:
         metadata: Dict,
         content_id: str,
         namespace: Optional[str] = None,
-        knowledge_base_id: Optional[int] = None
+        knowledge_base_id: Optional[int] = None,
+        commit: bool = True
     ) -> Tuple[bool, List[str]]:
-        """Index content as multiple chunks."""
+        """Index content as multiple chunks (commit=False leaves the transaction open)."""
         chunks = self._chunk_content(content, metadata.get("title", ""))
         
         if not chunks:
@@ -283,55 +475,55 @@ class RAGService:
         texts = [c["text"] for c in chunks]
         embeddings = await self._generate_embeddings_batch(texts)
         
-        # Prepare and insert vectors
+        # Prepare all rows, then upsert them in a single executemany
+        total_chunks = len(chunks)
         chunk_ids = []
+        rows = []
         
         for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
             chunk_id = f"{content_id}_chunk_{i}"
             chunk_ids.append(chunk_id)
             
-            # Convert embedding to PostgreSQL vector format
-            embedding_str = "[" + ",".join(map(str, embedding)) + "]"
-            
             # Prepare metadata with chunk info
             chunk_metadata = {
                 **metadata,
                 "content": chunk["text"],
                 "chunk_index": i,
-                "total_chunks": len(chunks),
+                "total_chunks": total_chunks,
                 "parent_id": content_id
             }
             
-            # Insert or update vector embedding
-            insert_sql = """
-                INSERT INTO vector_embeddings 
-                    (id, knowledge_base_id, embedding, content, metadata, namespace, chunk_index, parent_id)
-                VALUES 
-                    (:id, :kb_id, :embedding::vector, :content, :metadata::jsonb, :namespace, :chunk_index, :parent_id)
-                ON CONFLICT (id) DO UPDATE SET
-                    embedding = EXCLUDED.embedding,
-                    content = EXCLUDED.content,
-                    metadata = EXCLUDED.metadata,
-                    namespace = EXCLUDED.namespace,
-                    chunk_index = EXCLUDED.chunk_index,
-                    parent_id = EXCLUDED.parent_id
-            """
-            
-            await self.db.execute(
-                text(insert_sql),
-                {
-                    "id": chunk_id,
-                    "kb_id": knowledge_base_id,
-                    "embedding": embedding_str,
-                    "content": chunk["text"],
-                    "metadata": json.dumps(chunk_metadata),
-                    "namespace": namespace,
-                    "chunk_index": i,
-                    "parent_id": content_id
-                }
-            )
+            rows.append({
+                "id": chunk_id,
+                "kb_id": knowledge_base_id,
+                "embedding": embedding,
+                "content": chunk["text"],
+                "metadata": orjson.dumps(chunk_metadata).decode(),
+                "namespace": namespace,
+                "chunk_index": i,
+                "parent_id": content_id
+            })
         
-        await self.db.commit()
+        # Insert or update vector embeddings
+        insert_sql = """
+            INSERT INTO vector_embeddings 
+                (id, knowledge_base_id, embedding, content, metadata, namespace, chunk_index, parent_id)
+            VALUES 
+                (:id, :kb_id, CAST(:embedding AS halfvec), :content, CAST(:metadata AS jsonb), :namespace, :chunk_index, :parent_id)
+            ON CONFLICT (id) DO UPDATE SET
+                embedding = EXCLUDED.embedding,
+                content = EXCLUDED.content,
+                metadata = EXCLUDED.metadata,
+                namespace = EXCLUDED.namespace,
+                chunk_index = EXCLUDED.chunk_index,
+                parent_id = EXCLUDED.parent_id
+        """
+        
+        await self.db.execute(text(insert_sql), rows)
+        
+        if commit:
+            await self.db.commit()
+            await self._invalidate_context_cache()
         logger.info(f"Indexed {len(chunk_ids)} chunks for: {content_id}")
         return True, chunk_ids
     
@@ -346,9 +538,6 @@ class RAGService:
         """Index content as a single vector."""
         embedding = await self._generate_embedding(content)
         
-        # Convert embedding to PostgreSQL vector format
-        embedding_str = "[" + ",".join(map(str, embedding)) + "]"
-        
         # Prepare metadata
         full_metadata = {**metadata, "content": content}
         
@@ -357,7 +546,7 @@ class RAGService:
             INSERT INTO vector_embeddings 
                 (id, knowledge_base_id, embedding, content, metadata, namespace, parent_id)
             VALUES 
-                (:id, :kb_id, :embedding::vector, :content, :metadata::jsonb, :namespace, :parent_id)
+                (:id, :kb_id, CAST(:embedding AS halfvec), :content, CAST(:metadata AS jsonb), :namespace, :parent_id)
             ON CONFLICT (id) DO UPDATE SET
                 embedding = EXCLUDED.embedding,
                 content = EXCLUDED.content,
@@ -371,15 +560,16 @@ class RAGService:
             {
                 "id": content_id,
                 "kb_id": knowledge_base_id,
-                "embedding": embedding_str,
+                "embedding": embedding,
                 "content": content,
-                "metadata": json.dumps(full_metadata),
+                "metadata": orjson.dumps(full_metadata).decode(),
                 "namespace": namespace,
                 "parent_id": content_id
             }
         )
         
         await self.db.commit()
+        await self._invalidate_context_cache()
         logger.info(f"Indexed single vector: {content_id}")
         return True, [content_id]
     
@@ -394,9 +584,9 @@ class RAGService:
             return False
         
         try:
-            # Delete chunks by parent_id
-            delete_sql = "DELETE FROM vector_embeddings WHERE parent_id = :parent_id"
-            params = {"parent_id": content_id}
+            # Delete chunks (by parent_id) and the main ID in one statement
+            delete_sql = "DELETE FROM vector_embeddings WHERE (parent_id = :content_id OR id = :content_id)"
+            params = {"content_id": content_id}
             
             if namespace:
                 delete_sql += " AND namespace = :namespace"
@@ -404,13 +594,8 @@ class RAGService:
             
             await self.db.execute(text(delete_sql), params)
             
-            # Also delete main ID
-            await self.db.execute(
-                text("DELETE FROM vector_embeddings WHERE id = :id"),
-                {"id": content_id}
-            )
-            
             await self.db.commit()
+            await self._invalidate_context_cache()
             logger.info(f"Deleted content: {content_id}")
             return True
         except Exception as e:
@@ -426,14 +611,44 @@ class RAGService:
         namespace: Optional[str] = None,
         knowledge_base_id: Optional[int] = None
     ) -> bool:
-        """Update existing content (delete and re-index)."""
-        await self.delete_content(content_id, namespace)
-        success, _ = await self.index_content(
-            content, metadata, content_id, 
-            namespace=namespace, 
-            knowledge_base_id=knowledge_base_id
-        )
-        return success
+        """
+        Update existing content in place.
+        
+        Chunks are upserted by their stable IDs, then only chunks beyond the
+        new chunk count are deleted, all in one transaction so readers never
+        see the content missing.
+        """
+        if not self.db:
+            logger.error("Database session not provided")
+            return False
+        
+        try:
+            success, chunk_ids = await self._index_chunked(
+                content, metadata, content_id,
+                namespace=namespace,
+                knowledge_base_id=knowledge_base_id,
+                commit=False
+            )
+            if not success:
+                await self.db.rollback()
+                return False
+            
+            await self.db.execute(
+                text(
+                    "DELETE FROM vector_embeddings "
+                    "WHERE parent_id = :content_id AND id <> ALL(CAST(:kept_ids AS varchar[]))"
+                ),
+                {"content_id": content_id, "kept_ids": chunk_ids}
+            )
+            
+            await self.db.commit()
+            await self._invalidate_context_cache()
+            logger.info(f"Updated content: {content_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Error updating content: {e}")
+            await self.db.rollback()
+            return False
     
     async def search_similar(
         self,
@@ -447,42 +662,18 @@ class RAGService:
             return []
         
         embedding = await self._generate_embedding(query)
-        embedding_str = "[" + ",".join(map(str, embedding)) + "]"
-        
-        query_sql = """
-            SELECT 
-                id,
-                metadata,
-                1 - (embedding <=> :query_vector::vector) as similarity
-            FROM vector_embeddings
-            WHERE 1 - (embedding <=> :query_vector::vector) > 0
-        """
         
-        params = {
-            "query_vector": embedding_str
-        }
-        
-        if namespace:
-            query_sql += " AND namespace = :namespace"
-            params["namespace"] = namespace
-        
-        if filter_metadata:
-            for key, value in filter_metadata.items():
-                query_sql += f" AND metadata->>:key_{key} = :value_{key}"
-                params[f"key_{key}"] = key
-                params[f"value_{key}"] = json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+        params = self._nearest_params(embedding, top_k, filter_metadata, namespace)
         
-        query_sql += " ORDER BY similarity DESC LIMIT :top_k"
-        params["top_k"] = top_k
-        
-        result = await self.db.execute(text(query_sql), params)
+        await self._prepare_hnsw_scan(params)
+        result = await self.db.execute(_SEARCH_SIMILAR_SQL, params)
         rows = result.fetchall()
         
         return [
             {
                 "id": row.id,
                 "score": float(row.similarity),
-                "metadata": row.metadata if isinstance(row.metadata, dict) else json.loads(row.metadata) if row.metadata else {}
+                "metadata": row.metadata or {}
             }
             for row in rows
         ]
@@ -545,37 +736,47 @@ class RAGService:
     
     def _split_by_paragraphs(self, content: str) -> List[str]:
         """Split content by paragraphs, combining small ones."""
+        chunk_size = self.chunk_config.chunk_size
         chunks = []
-        current = ""
-        
-        for para in re.split(r'\n\n+', content):
+        # Pieces (and separators) of the chunk being built; joined once on flush
+        parts: List[str] = []
+        current_len = 0
+        
+        def flush() -> None:
+            nonlocal current_len
+            if current_len:
+                chunks.append("".join(parts))
+            parts.clear()
+            current_len = 0
+        
+        for para in _PARAGRAPH_SPLIT_RE.split(content):
             para = para.strip()
             if not para:
                 continue
             
             # If paragraph is too large, split by sentences
-            if len(para) > self.chunk_config.chunk_size:
-                if current:
-                    chunks.append(current)
-                    current = ""
+            if len(para) > chunk_size:
+                flush()
                 
-                for sentence in re.split(r'(?<=[.!?])\s+', para):
-                    if len(current) + len(sentence) <= self.chunk_config.chunk_size:
-                        current += (" " if current else "") + sentence
+                for sentence in _SENTENCE_SPLIT_RE.split(para):
+                    if current_len + len(sentence) <= chunk_size:
+                        if current_len:
+                            parts.append(" ")
+                            current_len += 1
                     else:
-                        if current:
-                            chunks.append(current)
-                        current = sentence
+                        flush()
+                    parts.append(sentence)
+                    current_len += len(sentence)
             else:
                 # Combine paragraphs if they fit
-                if len(current) + len(para) + 2 <= self.chunk_config.chunk_size:
-                    current += ("\n\n" if current else "") + para
+                if current_len + len(para) + 2 <= chunk_size:
+                    if current_len:
+                        parts.append("\n\n")
+                        current_len += 2
                 else:
-                    if current:
-                        chunks.append(current)
-                    current = para
-        
-        if current:
-            chunks.append(current)
+                    flush()
+                parts.append(para)
+                current_len += len(para)
         
+        flush()
         return chunks
@@ -2,18 +2,30 @@
 Usage service - Business logic for usage tracking and rate limiting
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from datetime import datetime, timedelta
+from sqlalchemy import select, func, and_
+from sqlalchemy.dialects.postgresql import insert
+import calendar
+from datetime import datetime
 from app.db.models import UsageTracking, UserTier, User
 from app.core.config import settings
+from app.core.clients import get_redis_client
+from app.core.constants import USAGE_CACHE_TTL
 from app.core.exceptions import UsageLimitExceededError
 from app.schemas.usage import UsageStatus
 from app.services.user_service import UserService
 from app.utils.cost_calculator import estimate_cost_from_total_tokens
-import redis
 
-# Initialize Redis client
-redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+# Per-tier limits and upgrade links; settings are fixed for the process lifetime
+_MESSAGE_LIMITS = {
+    UserTier.BASIC.value: settings.BASIC_MEMBER_MESSAGES_PER_MONTH,
+    UserTier.VIP.value: settings.VIP_MEMBER_MESSAGES_PER_MONTH,
+}
+
+_UPGRADE_URLS = {
+    UserTier.BASIC.value: settings.UPGRADE_URL_VIP or settings.UPGRADE_URL_GENERIC,  # Trial -> Elite
+    UserTier.VIP.value: settings.UPGRADE_URL_GENERIC,  # Elite has no upgrade
+}
 
 
 class UsageService:
@@ -22,21 +34,20 @@ class UsageService:
     def __init__(self, db: AsyncSession):
         self.db = db
     
+    @staticmethod
+    def _current_period() -> tuple[datetime, datetime]:
+        """Return (first day, last day) of the current UTC month at midnight."""
+        period_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        last_day = calendar.monthrange(period_start.year, period_start.month)[1]
+        return period_start, period_start.replace(day=last_day)
+    
     def _get_message_limit(self, tier: str) -> int:
         """Get message limit for tier"""
-        limits = {
-            UserTier.BASIC.value: settings.BASIC_MEMBER_MESSAGES_PER_MONTH,
-            UserTier.VIP.value: settings.VIP_MEMBER_MESSAGES_PER_MONTH,
-        }
-        return limits.get(tier, settings.BASIC_MEMBER_MESSAGES_PER_MONTH)
+        return _MESSAGE_LIMITS.get(tier, settings.BASIC_MEMBER_MESSAGES_PER_MONTH)
     
     def _get_upgrade_url(self, tier: str) -> str:
         """Get upgrade URL based on current tier."""
-        upgrade_urls = {
-            UserTier.BASIC.value: settings.UPGRADE_URL_VIP or settings.UPGRADE_URL_GENERIC,  # Trial -> Elite
-            UserTier.VIP.value: settings.UPGRADE_URL_GENERIC,  # Elite has no upgrade
-        }
-        return upgrade_urls.get(tier, settings.UPGRADE_URL_GENERIC) or ""
+        return _UPGRADE_URLS.get(tier, settings.UPGRADE_URL_GENERIC) or ""
     
     async def check_usage_limit(self, user_id: int, tier: str) -> bool:
         """
@@ -65,13 +76,11 @@ class UsageService:
                 )
         
         # Get current period
-        now = datetime.utcnow()
-        period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        period_end = (period_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        period_start, period_end = self._current_period()
         
         # Check Redis cache first
         cache_key = f"usage:{user_id}:{period_start.strftime('%Y-%m')}"
-        cached_count = redis_client.get(cache_key)
+        cached_count = await get_redis_client().get(cache_key)
         
         if cached_count:
             messages_used = int(cached_count)
@@ -87,7 +96,7 @@ class UsageService:
             )
             messages_used = result.scalar() or 0
             # Cache for 1 hour
-            redis_client.setex(cache_key, 3600, messages_used)
+            await get_redis_client().setex(cache_key, USAGE_CACHE_TTL, messages_used)
         
         limit = self._get_message_limit(tier)
         
@@ -108,60 +117,58 @@ class UsageService:
         
         Calculates and tracks API costs based on token usage.
         """
-        now = datetime.utcnow()
-        period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        period_end = (period_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        period_start, period_end = self._current_period()
         
         # Calculate API cost
         cost_usd = estimate_cost_from_total_tokens(tokens_used)
         cost_micro_dollars = int(cost_usd * 1_000_000)  # Store in micro-dollars for precision
         
-        # Get or create usage tracking record
-        result = await self.db.execute(
-            select(UsageTracking)
-            .where(
-                UsageTracking.user_id == user_id,
-                UsageTracking.period_start == period_start
-            )
+        # Create or increment the period's usage row in one statement
+        stmt = insert(UsageTracking).values(
+            user_id=user_id,
+            period_start=period_start,
+            period_end=period_end,
+            messages_count=1,
+            tokens_used=tokens_used,
+            api_cost=cost_micro_dollars
         )
-        usage = result.scalar_one_or_none()
-        
-        if usage:
-            usage.messages_count += 1
-            usage.tokens_used += tokens_used
-            usage.api_cost += cost_micro_dollars
-        else:
-            usage = UsageTracking(
-                user_id=user_id,
-                period_start=period_start,
-                period_end=period_end,
-                messages_count=1,
-                tokens_used=tokens_used,
-                api_cost=cost_micro_dollars
-            )
-            self.db.add(usage)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UsageTracking.user_id, UsageTracking.period_start],
+            set_={
+                "messages_count": UsageTracking.messages_count + 1,
+                "tokens_used": UsageTracking.tokens_used + stmt.excluded.tokens_used,
+                "api_cost": UsageTracking.api_cost + stmt.excluded.api_cost,
+            }
+        )
+        await self.db.execute(stmt)
         
         await self.db.commit()
         
-        # Update Redis cache
+        # Update Redis cache (one round-trip for both commands)
         cache_key = f"usage:{user_id}:{period_start.strftime('%Y-%m')}"
-        redis_client.incr(cache_key)
-        redis_client.expire(cache_key, 3600)
+        async with get_redis_client().pipeline(transaction=False) as pipe:
+            pipe.incr(cache_key)
+            pipe.expire(cache_key, USAGE_CACHE_TTL)
+            await pipe.execute()
     
     async def get_usage_status(self, user_id: int, tier: str) -> UsageStatus:
         """Get current usage status for user"""
-        now = datetime.utcnow()
-        period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        period_end = (period_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        period_start, period_end = self._current_period()
         
+        # Load the user (for trial info) and this period's usage in one round-trip
         result = await self.db.execute(
-            select(UsageTracking)
-            .where(
-                UsageTracking.user_id == user_id,
-                UsageTracking.period_start == period_start
+            select(User, UsageTracking)
+            .outerjoin(
+                UsageTracking,
+                and_(
+                    UsageTracking.user_id == User.id,
+                    UsageTracking.period_start == period_start
+                )
             )
+            .where(User.id == user_id)
         )
-        usage = result.scalar_one_or_none()
+        row = result.first()
+        user, usage = row if row else (None, None)
         
         messages_used = usage.messages_count if usage else 0
         tokens_used = usage.tokens_used if usage else 0
@@ -175,15 +182,9 @@ class UsageService:
         trial_end_date = None
         
         if tier == UserTier.BASIC.value:
-            user_service = UserService(self.db)
-            trial_status = await user_service.get_trial_status(user_id)
+            trial_status = UserService.trial_status_for(user)
             trial_active = trial_status.get("trial_active", False)
             trial_days_remaining = trial_status.get("days_remaining", 0)
-            # Get trial_end_date from user object directly
-            user_result = await self.db.execute(
-                select(User).where(User.id == user_id)
-            )
-            user = user_result.scalar_one_or_none()
             if user and user.trial_end_date:
                 trial_end_date = user.trial_end_date
         
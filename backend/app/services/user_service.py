@@ -7,19 +7,44 @@ Provides:
 - Password management
 - User statistics
 """
-from typing import Optional, List, Dict
+import asyncio
+import copy
+import logging
+from dataclasses import dataclass, asdict
+from typing import Optional, List, Dict, Sequence, Set, Tuple, AsyncIterator
+
+import orjson
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, update, func, inspect, and_, or_, tuple_, bindparam, any_, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import InstrumentedAttribute, make_transient_to_detached
 
 from app.db.models import User, UserTier
 from app.core.security import get_password_hash
 from app.core.config import settings
+from app.core.clients import get_redis_client
 from app.core.constants import (
     MIN_PASSWORD_LENGTH,
+    PASSWORD_HASH_MAX_CONCURRENCY,
     TRIAL_PERIOD_DAYS,
     DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    STREAM_BATCH_SIZE,
+    USER_CACHE_SIZE,
+    USER_CACHE_TTL,
+    USER_REDIS_CACHE_TTL,
+    USER_INVALIDATE_CHANNEL,
+    USER_INVALIDATE_ATTEMPTS,
+    USER_INVALIDATE_MAX_BACKOFF,
+)
+from app.core.query_helpers import (
+    get_paginated_results,
+    count_records,
+    encode_cursor,
+    decode_cursor,
 )
-from app.core.query_helpers import get_paginated_results, count_records
 from app.core.performance import optimize_query
 from app.core.exceptions import (
     NotFoundError,
@@ -29,6 +54,119 @@ from app.core.exceptions import (
 from app.services.base import BaseService
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthUser:
+    """Columns the auth dependencies need; safe to cache outside a session."""
+    id: int
+    username: str
+    email: str
+    tier: UserTier
+    is_active: bool
+    is_admin: bool
+    is_moderator: bool
+    is_super_admin: bool
+
+
+# Users found by email/username, shared across requests. Entries are column
+# snapshots rather than session-bound instances, and are dropped on every
+# write made through UserService. Emails are keyed lowercased
+_user_email_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+_user_username_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+# Auth rows by user ID: this per-process cache sits in front of Redis
+# (user:{id}), which in turn sits in front of the database. Each Redis row
+# carries the user's generation (user:{id}:gen) at the time it was read;
+# writes bump the generation, so rows filled from a pre-write read are ignored
+_auth_user_cache: TTLCache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
+# Bumped on every local eviction; a fill that started before an eviction
+# doesn't store its (possibly stale) result
+_evictions = 0
+
+
+def _forget_user(user_id: int, email: str, username: str) -> None:
+    """Evict a user from this process's caches."""
+    global _evictions
+    _evictions += 1
+    _auth_user_cache.pop(user_id, None)
+    _user_email_cache.pop(email.lower(), None)
+    _user_username_cache.pop(username, None)
+
+
+def _forget_all_users() -> None:
+    """Evict every user from this process's caches."""
+    global _evictions
+    _evictions += 1
+    _auth_user_cache.clear()
+    _user_email_cache.clear()
+    _user_username_cache.clear()
+
+
+async def listen_for_user_invalidations() -> None:
+    """
+    Evict this worker's cached users when any worker publishes a change.
+    
+    Runs until cancelled; start it once per process at application startup.
+    Reconnects with exponential backoff while Redis is unreachable.
+    """
+    delay = 1
+    disconnected = False
+    while True:
+        pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(USER_INVALIDATE_CHANNEL)
+            if disconnected:
+                # Changes published while disconnected were missed
+                logger.info("User invalidation listener reconnected")
+                _forget_all_users()
+                disconnected = False
+            delay = 1
+            async for message in pubsub.listen():
+                data = orjson.loads(message["data"])
+                _forget_user(data["id"], data["email"], data["username"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not disconnected:
+                logger.warning(f"User invalidation listener error, retrying: {e}")
+                _forget_all_users()
+                disconnected = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, USER_INVALIDATE_MAX_BACKOFF)
+        finally:
+            await pubsub.aclose()
+
+# Hot-path lookups, built once and executed with bound values
+_SELECT_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_SELECT_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+# Emails match case-insensitively through the lower(email) expression index
+_SELECT_USER_BY_EMAIL = select(User).where(func.lower(User.email) == bindparam("email"))
+
+# Batch existence checks; one array parameter keeps a single prepared
+# statement whatever the batch size (IN would expand per list length)
+_SELECT_TAKEN_USERNAMES = select(User.username).where(
+    User.username == any_(bindparam("usernames", type_=ARRAY(String)))
+)
+_SELECT_TAKEN_EMAILS = select(func.lower(User.email)).where(
+    func.lower(User.email) == any_(bindparam("emails", type_=ARRAY(String)))
+)
+
+# Columns the auth dependencies read, fetched as a plain Row (no ORM instance)
+_SELECT_AUTH_USER_BY_ID = select(
+    User.id,
+    User.username,
+    User.email,
+    User.tier,
+    User.is_active,
+    User.is_admin,
+    User.is_moderator,
+    User.is_super_admin,
+).where(User.id == bindparam("user_id"))
+
 
 class UserService(BaseService[User]):
     """Service for user-related operations."""
@@ -42,30 +180,226 @@ class UserService(BaseService[User]):
     
     async def get_user_by_username(self, username: str) -> Optional[User]:
         """Get user by username."""
-        result = await self.db.execute(
-            select(User).where(User.username == username)
-        )
-        return result.scalar_one_or_none()
+        cached = _user_username_cache.get(username)
+        if cached is not None:
+            return await self._attach_cached(cached)
+        
+        evictions = _evictions
+        result = await self.db.execute(_SELECT_USER_BY_USERNAME, {"username": username})
+        return self._cache_user(result.scalar_one_or_none(), evictions)
     
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get user by email."""
-        result = await self.db.execute(
-            select(User).where(User.email == email)
-        )
-        return result.scalar_one_or_none()
+        """Get user by email, ignoring case and surrounding whitespace."""
+        email = email.strip().lower()
+        cached = _user_email_cache.get(email)
+        if cached is not None:
+            return await self._attach_cached(cached)
+        
+        evictions = _evictions
+        result = await self.db.execute(_SELECT_USER_BY_EMAIL, {"email": email})
+        return self._cache_user(result.scalar_one_or_none(), evictions)
     
     async def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID."""
-        return await self.get_by_id(user_id)
+        result = await self.db.execute(_SELECT_USER_BY_ID, {"user_id": user_id})
+        return result.scalar_one_or_none()
+    
+    async def exists_usernames(self, usernames: Sequence[str]) -> Set[str]:
+        """
+        Return which of the given usernames are already taken, in one query.
+        
+        Args:
+            usernames: Usernames to check
+            
+        Returns:
+            The subset of usernames that exist
+        """
+        if not usernames:
+            return set()
+        result = await self.db.execute(_SELECT_TAKEN_USERNAMES, {"usernames": list(usernames)})
+        return set(result.scalars().all())
+    
+    async def exists_emails(self, emails: Sequence[str]) -> Set[str]:
+        """
+        Return which of the given emails are already registered, in one query.
+        
+        Emails are compared case-insensitively.
+        
+        Args:
+            emails: Emails to check
+            
+        Returns:
+            The subset of emails that exist, lowercased
+        """
+        if not emails:
+            return set()
+        result = await self.db.execute(
+            _SELECT_TAKEN_EMAILS, {"emails": [email.strip().lower() for email in emails]}
+        )
+        return set(result.scalars().all())
+    
+    async def get_user_by_id_fast(self, user_id: int) -> Optional[AuthUser]:
+        """
+        Get the columns authentication needs for a user, as a read-only AuthUser.
+        
+        Served from the process cache, then Redis, then the database, and
+        skips ORM instance construction; use get_user_by_id when the user
+        will be modified.
+        """
+        user = _auth_user_cache.get(user_id)
+        if user is not None:
+            return user
+        evictions = _evictions
+        
+        cache_key = f"user:{user_id}"
+        generation = None
+        try:
+            cached, generation = await get_redis_client().mget(cache_key, f"{cache_key}:gen")
+            generation = int(generation or 0)
+            if cached:
+                data = orjson.loads(cached)
+                # A row read before the latest write carries an older generation
+                if data.pop("gen", None) == generation:
+                    data["tier"] = UserTier(data["tier"])
+                    user = AuthUser(**data)
+        except Exception as e:
+            generation = None
+            self.logger.warning(f"User cache read error: {e}")
+        
+        if user is None:
+            result = await self.db.execute(_SELECT_AUTH_USER_BY_ID, {"user_id": user_id})
+            row = result.one_or_none()
+            if row is None:
+                return None
+            user = AuthUser(*row)
+            if generation is not None:
+                try:
+                    await get_redis_client().setex(
+                        cache_key,
+                        USER_REDIS_CACHE_TTL,
+                        orjson.dumps({**asdict(user), "gen": generation})
+                    )
+                except Exception as e:
+                    self.logger.warning(f"User cache write error: {e}")
+        
+        if evictions == _evictions:
+            _auth_user_cache[user_id] = user
+        return user
     
     async def get_user_or_raise(self, user_id: int) -> User:
         """Get user by ID or raise NotFoundError."""
-        return await self.get_by_id_or_raise(user_id, "User")
+        user = await self.get_user_by_id(user_id)
+        if not user:
+            raise NotFoundError("User", user_id)
+        return user
+    
+    # =========================================================================
+    # Lookup Cache
+    # =========================================================================
+    
+    @staticmethod
+    def _cache_user(user: Optional[User], evictions: int) -> Optional[User]:
+        """
+        Store a freshly loaded user's columns under its email and username.
+        
+        Args:
+            user: The loaded user, if any
+            evictions: Value of _evictions before the load started; the
+                user is not cached if an eviction happened since
+        """
+        if user is not None and evictions == _evictions:
+            # Deep copy so later changes to JSON columns (profile_data) on
+            # this instance don't leak into the shared snapshot
+            snapshot = copy.deepcopy({key: getattr(user, key) for key in _USER_COLUMNS})
+            _user_email_cache[user.email.lower()] = snapshot
+            _user_username_cache[user.username] = snapshot
+        return user
+    
+    async def _attach_cached(self, snapshot: Dict) -> User:
+        """Rebuild a cached user as a persistent instance of this session, without a query."""
+        # Prefer an instance this session already holds; it may be newer
+        key = inspect(User).identity_key_from_primary_key((snapshot["id"],))
+        existing = self.db.identity_map.get(key)
+        if existing is not None:
+            return existing
+        
+        # Each request gets its own copy of mutable JSON columns
+        user = User(**copy.deepcopy(snapshot))
+        make_transient_to_detached(user)
+        return await self.db.merge(user, load=False)
+    
+    async def invalidate_user_cache(
+        self,
+        user: User,
+        old_email: Optional[str] = None,
+        old_username: Optional[str] = None
+    ) -> None:
+        """
+        Drop a user's cached lookups in every worker; call after any write to the row.
+        
+        Args:
+            user: The user as written
+            old_email: Previous email, when the write changed it
+            old_username: Previous username, when the write changed it
+        
+        Never raises: the write has already committed. If Redis stays
+        unreachable the failure is logged, and other workers may serve the
+        old row until their caches expire.
+        """
+        keys = {(user.email, user.username), (old_email or user.email, old_username or user.username)}
+        for email, username in keys:
+            _forget_user(user.id, email, username)
+        
+        for attempt in range(USER_INVALIDATE_ATTEMPTS):
+            try:
+                async with get_redis_client().pipeline(transaction=False) as pipe:
+                    # Bump the generation first so in-flight fills are ignored
+                    pipe.incr(f"user:{user.id}:gen")
+                    pipe.delete(f"user:{user.id}")
+                    for email, username in keys:
+                        pipe.publish(
+                            USER_INVALIDATE_CHANNEL,
+                            orjson.dumps({"id": user.id, "email": email, "username": username})
+                        )
+                    await pipe.execute()
+                return
+            except Exception as e:
+                if attempt + 1 < USER_INVALIDATE_ATTEMPTS:
+                    await asyncio.sleep(0.1 * 2 ** attempt)
+                else:
+                    self.logger.error(f"User cache invalidation failed for user {user.id}: {e}")
     
     # =========================================================================
     # User CRUD Methods
     # =========================================================================
     
+    async def _ensure_available(self, username: Optional[str], email: Optional[str]) -> None:
+        """
+        Check that a username and email are unused, in a single query.
+        
+        Emails are compared case-insensitively.
+        
+        Raises:
+            AlreadyExistsError: If either is taken (username reported first)
+        """
+        conditions = []
+        if username:
+            conditions.append(User.username == username)
+        if email:
+            email = email.lower()
+            conditions.append(func.lower(User.email) == email)
+        if not conditions:
+            return
+        
+        result = await self.db.execute(
+            select(User.username, User.email).where(or_(*conditions)).limit(2)
+        )
+        rows = result.all()
+        if username and any(row.username == username for row in rows):
+            raise AlreadyExistsError("User", "username", username)
+        if email and any(row.email.lower() == email for row in rows):
+            raise AlreadyExistsError("User", "email", email)
+    
     async def create_user(
         self,
         email: str,
@@ -91,41 +425,146 @@ class UserService(BaseService[User]):
         Raises:
             AlreadyExistsError: If username or email already exists
         """
-        # Check for existing username
-        if await self.get_user_by_username(username):
-            raise AlreadyExistsError("User", "username", username)
+        # Check for existing username or email
+        await self._ensure_available(username, email)
         
-        # Check for existing email
-        if await self.get_user_by_email(email):
-            raise AlreadyExistsError("User", "email", email)
-        
-        # Set trial period for Basic tier
+        # Set trial period for Basic tier, from the database clock
         trial_start = None
         trial_end = None
         if tier == UserTier.BASIC and start_trial:
-            trial_start = datetime.utcnow()
-            trial_end = trial_start + timedelta(days=TRIAL_PERIOD_DAYS)
-        
-        user = User(
-            email=email,
-            username=username,
-            hashed_password=get_password_hash(password),
-            tier=tier,
-            is_admin=is_admin,
-            is_active=True,
-            trial_start_date=trial_start,
-            trial_end_date=trial_end
-        )
-        self.db.add(user)
+            trial_start = func.now()
+            trial_end = func.now() + timedelta(days=TRIAL_PERIOD_DAYS)
+        
+        # bcrypt is CPU-bound; hash off the event loop
+        hashed_password = await asyncio.to_thread(get_password_hash, password)
+        
+        # RETURNING brings back the id, server defaults and trial dates
+        # without a refresh
+        try:
+            result = await self.db.execute(
+                insert(User).values(
+                    email=email,
+                    username=username,
+                    hashed_password=hashed_password,
+                    tier=tier,
+                    is_admin=is_admin,
+                    is_active=True,
+                    trial_start_date=trial_start,
+                    trial_end_date=trial_end
+                ).returning(User)
+            )
+        except IntegrityError:
+            # A concurrent sign-up took the username or email after the check
+            await self.db.rollback()
+            await self._ensure_available(username, email)
+            raise
+        user = result.scalar_one()
+        # Nothing is cached for users that don't exist yet, so there is
+        # nothing to invalidate
         await self.db.commit()
-        await self.db.refresh(user)
         
         self.logger.info(
             f"Created user: {username} (id={user.id}, tier={tier.value}"
-            f"{', trial ends: ' + trial_end.isoformat() if trial_end else ''})"
+            f"{', trial ends: ' + user.trial_end_date.isoformat() if user.trial_end_date else ''})"
         )
         return user
     
+    async def create_users_bulk(
+        self,
+        users: List[Dict],
+        tier: UserTier = UserTier.BASIC,
+        start_trial: bool = True
+    ) -> List[User]:
+        """
+        Create many users with one existence check and one multi-row INSERT.
+        
+        Args:
+            users: Dicts with email, username and password
+            tier: Membership tier for every user (defaults to BASIC)
+            start_trial: Start the trial period for Basic users
+            
+        Returns:
+            Created User instances, in input order
+            
+        Raises:
+            ValidationError: If the batch repeats a username or email
+            AlreadyExistsError: If a username or email already exists
+        """
+        if not users:
+            return []
+        
+        usernames = [u["username"] for u in users]
+        emails = [u["email"].lower() for u in users]
+        for field, values in (("username", usernames), ("email", emails)):
+            if len(set(values)) != len(values):
+                raise ValidationError(f"Duplicate {field} in batch", field)
+        
+        await self._ensure_batch_available(usernames, emails)
+        
+        # Hash in worker threads, a few at a time so the default executor
+        # stays free for request-path work such as login
+        semaphore = asyncio.Semaphore(PASSWORD_HASH_MAX_CONCURRENCY)
+        
+        async def hash_password(password: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(get_password_hash, password)
+        
+        hashed_passwords = await asyncio.gather(*(hash_password(u["password"]) for u in users))
+        
+        stmt = insert(User)
+        if tier == UserTier.BASIC and start_trial:
+            # Same database clock as create_user, applied to every row
+            stmt = stmt.values(
+                trial_start_date=func.now(),
+                trial_end_date=func.now() + timedelta(days=TRIAL_PERIOD_DAYS)
+            )
+        
+        try:
+            result = await self.db.execute(
+                stmt.returning(User, sort_by_parameter_order=True),
+                [
+                    {
+                        "email": u["email"],
+                        "username": u["username"],
+                        "hashed_password": hashed_password,
+                        "tier": tier,
+                        "is_admin": False,
+                        "is_active": True,
+                    }
+                    for u, hashed_password in zip(users, hashed_passwords)
+                ]
+            )
+        except IntegrityError:
+            # A concurrent insert took a username or email after the check
+            await self.db.rollback()
+            await self._ensure_batch_available(usernames, emails)
+            raise
+        created = list(result.scalars().all())
+        await self.db.commit()
+        
+        self.logger.info(f"Bulk created {len(created)} users (tier={tier.value})")
+        return created
+    
+    async def _ensure_batch_available(self, usernames: List[str], emails: List[str]) -> None:
+        """
+        Check that none of the usernames or (lowercased) emails are taken, in one query.
+        
+        Raises:
+            AlreadyExistsError: If any is taken (usernames reported first)
+        """
+        result = await self.db.execute(
+            select(User.username, User.email).where(
+                or_(User.username.in_(usernames), func.lower(User.email).in_(emails))
+            )
+        )
+        taken = result.all()
+        wanted_usernames = set(usernames)
+        for row in taken:
+            if row.username in wanted_usernames:
+                raise AlreadyExistsError("User", "username", row.username)
+        if taken:
+            raise AlreadyExistsError("User", "email", taken[0].email)
+    
     async def update_user(
         self,
         user_id: int,
@@ -150,31 +589,53 @@ class UserService(BaseService[User]):
             NotFoundError: If user not found
             AlreadyExistsError: If new username/email already taken
         """
-        user = await self.get_user_or_raise(user_id)
-        
-        # Check for duplicate username
-        if username and username != user.username:
-            if await self.get_user_by_username(username):
-                raise AlreadyExistsError("User", "username", username)
-            user.username = username
-        
-        # Check for duplicate email
-        if email and email != user.email:
-            if await self.get_user_by_email(email):
-                raise AlreadyExistsError("User", "email", email)
-            user.email = email
-        
-        if tier is not None:
-            user.tier = tier
-        if is_active is not None:
-            user.is_active = is_active
-        if is_admin is not None:
-            user.is_admin = is_admin
-        if profile_data is not None:
-            user.profile_data = profile_data
+        user = None
+        old_email = old_username = None
+        if username or email:
+            # Current values decide whether username/email really change, and
+            # their cache entries must go before they do
+            user = await self.get_user_or_raise(user_id)
+            await self.invalidate_user_cache(user)
+            # The UPDATE overwrites this instance; keep the keys to evict again
+            old_email, old_username = user.email, user.username
+            if username == user.username:
+                username = None
+            if email == user.email:
+                email = None
+            # A change of case alone keeps the user's own address
+            email_is_new = email and email.lower() != user.email.lower()
+            await self._ensure_available(username, email if email_is_new else None)
+        
+        changes = {
+            field: value
+            for field, value in (
+                ("username", username or None),
+                ("email", email or None),
+                ("tier", tier),
+                ("is_active", is_active),
+                ("is_admin", is_admin),
+                ("profile_data", profile_data),
+            )
+            if value is not None
+        }
+        
+        if changes:
+            # One UPDATE ... RETURNING instead of load, flush and refresh
+            result = await self.db.execute(
+                update(User).where(User.id == user_id).values(**changes).returning(User),
+                execution_options={"populate_existing": True}
+            )
+            user = result.scalar_one_or_none()
+        elif user is None:
+            user = await self.get_user_by_id(user_id)
+        
+        if user is None:
+            raise NotFoundError("User", user_id)
         
         await self.db.commit()
-        await self.db.refresh(user)
+        # Workers may have re-cached the old email/username since the first
+        # eviction; drop those keys again now that the change is visible
+        await self.invalidate_user_cache(user, old_email, old_username)
         
         self.logger.info(f"Updated user: {user.username} (id={user_id})")
         return user
@@ -200,9 +661,8 @@ class UserService(BaseService[User]):
                 "password"
             )
         
-        user = await self.get_user_or_raise(user_id)
-        user.hashed_password = get_password_hash(new_password)
-        await self.db.commit()
+        hashed_password = await asyncio.to_thread(get_password_hash, new_password)
+        user = await self._set_columns(user_id, hashed_password=hashed_password)
         
         self.logger.info(f"Updated password for user: {user.username}")
         return True
@@ -217,13 +677,60 @@ class UserService(BaseService[User]):
         Returns:
             True if successful
         """
-        user = await self.get_user_or_raise(user_id)
-        user.is_active = False
-        await self.db.commit()
+        user = await self._set_columns(user_id, is_active=False)
         
         self.logger.info(f"Deactivated user: {user.username}")
         return True
     
+    async def _set_columns(self, user_id: int, **values):
+        """
+        Write columns with a single UPDATE ... RETURNING and commit.
+        
+        Returns:
+            Row with the user's id, username and email
+            
+        Raises:
+            NotFoundError: If user not found
+        """
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(User.id, User.username, User.email)
+        )
+        user = result.one_or_none()
+        if user is None:
+            raise NotFoundError("User", user_id)
+        
+        await self.db.commit()
+        await self.invalidate_user_cache(user)
+        return user
+    
+    # The generic BaseService writes, extended to drop the user's cached
+    # lookups like every other write in this service
+    
+    async def update(self, id: int, refresh: bool = False, **data) -> Optional[User]:
+        """Update a user by ID (see BaseService.update) and invalidate its cache."""
+        user = await self.get_by_id(id)
+        if user is None:
+            return None
+        old_email, old_username = user.email, user.username
+        
+        user = await super().update(id, refresh=refresh, **data)
+        await self.invalidate_user_cache(user, old_email, old_username)
+        return user
+    
+    async def delete(self, id: int) -> bool:
+        """Delete a user by ID (see BaseService.delete) and invalidate its cache."""
+        user = await self.get_by_id(id)
+        if user is None:
+            return False
+        
+        deleted = await super().delete(id)
+        if deleted:
+            await self.invalidate_user_cache(user)
+        return deleted
+    
     # =========================================================================
     # User Listing Methods (for Admin)
     # =========================================================================
@@ -233,8 +740,9 @@ class UserService(BaseService[User]):
         limit: int = DEFAULT_PAGE_LIMIT,
         offset: int = 0,
         tier: Optional[UserTier] = None,
-        active_only: bool = True
-    ) -> List[User]:
+        active_only: bool = True,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
+    ) -> List:
         """
         List users with optional filtering.
         
@@ -243,9 +751,10 @@ class UserService(BaseService[User]):
             offset: Pagination offset
             tier: Filter by tier
             active_only: Only return active users
+            columns: Load only these User columns (e.g. to skip hashed_password)
             
         Returns:
-            List of User instances
+            List of User instances, or Row tuples when columns are given
         """
         filters = {}
         if active_only:
@@ -260,9 +769,99 @@ class UserService(BaseService[User]):
             offset=offset,
             filters=filters,
             order_by="created_at",
-            descending=True
+            descending=True,
+            columns=columns
         )
     
+    async def list_users_keyset(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        tier: Optional[UserTier] = None,
+        active_only: bool = True,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
+    ) -> Tuple[List, Optional[str]]:
+        """
+        List users newest first with keyset pagination.
+        
+        Each page seeks past the previous one's last (created_at, id) instead
+        of skipping rows, so deep pages cost the same as the first. Prefer
+        this over list_users' offset for admin listings.
+        
+        Args:
+            limit: Max users to return
+            cursor: Cursor returned with the previous page (None for the first)
+            tier: Filter by tier
+            active_only: Only return active users
+            columns: Load only these User columns (must include id and created_at)
+            
+        Returns:
+            Tuple of (users, next_cursor); next_cursor is None on the last page
+            
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        query = self._listing_query(tier, active_only, columns)
+        if cursor:
+            try:
+                created_at, last_id = decode_cursor(cursor)
+            except ValueError:
+                raise ValidationError("Invalid pagination cursor", "cursor")
+            query = query.where(
+                tuple_(User.created_at, User.id) < tuple_(created_at, last_id)
+            )
+        
+        limit = min(limit, MAX_PAGE_LIMIT)
+        result = await self.db.execute(
+            query.order_by(User.created_at.desc(), User.id.desc()).limit(limit)
+        )
+        users = list(result.all()) if columns else list(result.scalars().all())
+        
+        next_cursor = None
+        if len(users) == limit:
+            last = users[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return users, next_cursor
+    
+    async def list_users_stream(
+        self,
+        tier: Optional[UserTier] = None,
+        active_only: bool = True,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None,
+        batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator:
+        """
+        Iterate over all matching users through a server-side cursor.
+        
+        Rows arrive batch_size at a time, so memory stays bounded however
+        many users match. Meant for exports and background jobs; the session
+        is busy until iteration finishes.
+        
+        Yields:
+            User instances, or Row tuples when columns are given
+        """
+        query = self._listing_query(tier, active_only, columns).order_by(User.id)
+        result = await self.db.stream(query.execution_options(yield_per=batch_size))
+        if not columns:
+            result = result.scalars()
+        async for partition in result.partitions():
+            for user in partition:
+                yield user
+    
+    @staticmethod
+    def _listing_query(
+        tier: Optional[UserTier],
+        active_only: bool,
+        columns: Optional[Sequence[InstrumentedAttribute]]
+    ):
+        """Select users (or the given columns) with the listing filters applied."""
+        query = select(*columns) if columns else select(User)
+        if active_only:
+            query = query.where(User.is_active == True)
+        if tier:
+            query = query.where(User.tier == tier)
+        return query
+    
     async def get_user_count(self, active_only: bool = True) -> int:
         """Get total user count."""
         filters = {"is_active": True} if active_only else {}
@@ -277,6 +876,31 @@ class UserService(BaseService[User]):
         )
         return {tier.value: count for tier, count in result.all()}
     
+    async def get_dashboard_stats(self) -> Dict:
+        """
+        Get total, active and per-tier active user counts in one query.
+        
+        Returns:
+            Dict with total, active and by_tier (active users per tier)
+        """
+        # ROLLUP adds a grand-total row (tier NULL) to the per-tier rows
+        result = await self.db.execute(
+            select(
+                User.tier,
+                func.count(User.id),
+                func.count(User.id).filter(User.is_active == True)
+            )
+            .group_by(func.rollup(User.tier))
+        )
+        stats = {"total": 0, "active": 0, "by_tier": {}}
+        for tier, total, active in result.all():
+            if tier is None:
+                stats["total"] = total
+                stats["active"] = active
+            elif active:
+                stats["by_tier"][tier.value] = active
+        return stats
+    
     # =========================================================================
     # Trial Management
     # =========================================================================
@@ -288,14 +912,13 @@ class UserService(BaseService[User]):
         Returns:
             True if trial is active, False otherwise
         """
-        user = await self.get_user_by_id(user_id)
-        if not user or user.tier != UserTier.BASIC:
-            return False
-        
-        if not user.trial_end_date:
-            return False
-        
-        return datetime.utcnow() < user.trial_end_date
+        # Evaluated in SQL against the DB clock; a NULL trial_end_date yields NULL
+        result = await self.db.execute(
+            select(
+                and_(User.tier == UserTier.BASIC, User.trial_end_date > func.now())
+            ).where(User.id == user_id)
+        )
+        return bool(result.scalar_one_or_none())
     
     async def get_trial_status(self, user_id: int) -> Dict:
         """
@@ -304,7 +927,16 @@ class UserService(BaseService[User]):
         Returns:
             Dict with trial_active, days_remaining, trial_end_date
         """
-        user = await self.get_user_by_id(user_id)
+        # Only the trial columns are needed, not the full user row
+        result = await self.db.execute(
+            select(User.tier, User.trial_start_date, User.trial_end_date)
+            .where(User.id == user_id)
+        )
+        return self.trial_status_for(result.one_or_none())
+    
+    @staticmethod
+    def trial_status_for(user: Optional[User]) -> Dict:
+        """Compute trial status from a loaded user (or a row with its trial columns)."""
         if not user or user.tier != UserTier.BASIC:
             return {
                 "trial_active": False,
@@ -6,7 +6,6 @@ Provides dependency functions for checking usage limits in endpoints.
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db
-from app.services.usage_service import UsageService
 from app.core.exceptions import UsageLimitExceededError, to_http_exception
 from app.dependencies import get_current_user
 
@@ -36,6 +35,9 @@ async def check_usage_limit_dependency(
     Returns:
         Current user dict (for convenience)
     """
+    # Imported here: usage_service imports app.utils (cost calculator)
+    from app.services.usage_service import UsageService
+    
     usage_service = UsageService(db)
     try:
         await usage_service.check_usage_limit(
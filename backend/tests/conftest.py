@@ -0,0 +1,12 @@
+"""
+Shared test setup.
+"""
+import os
+
+# Integration tests run the application's own engine against the test database
+if os.getenv("TEST_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+
+# Import the application first so modules initialize in the same order as
+# in the server (app.core and app.db import each other)
+import app.main  # noqa: E402,F401
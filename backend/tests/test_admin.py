@@ -0,0 +1,125 @@
+"""
+Admin Endpoint Tests
+
+Request handling for the admin user endpoints, with the database session,
+admin check and UserService stubbed out.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import admin
+from app.core.exceptions import AlreadyExistsError, TayAIError
+from app.db.database import get_db
+from app.db.models import UserTier
+from app.dependencies import get_current_admin
+from app.main import tayai_exception_handler
+from app.services.user_service import UserService
+
+
+def _user(id: int, email: str, username: str, tier: UserTier) -> SimpleNamespace:
+    """Object shaped like a created User row."""
+    return SimpleNamespace(
+        id=id,
+        email=email,
+        username=username,
+        tier=tier,
+        is_active=True,
+        is_admin=False,
+        created_at=datetime(2026, 1, 1),
+        profile_data=None,
+    )
+
+
+@pytest.fixture
+def bulk_calls(monkeypatch):
+    """Record create_users_bulk calls and return a User per input."""
+    calls = []
+    
+    async def fake_create_users_bulk(self, users, tier=UserTier.BASIC, start_trial=True):
+        calls.append({"users": users, "tier": tier})
+        return [_user(i + 1, u["email"], u["username"], tier) for i, u in enumerate(users)]
+    
+    monkeypatch.setattr(UserService, "create_users_bulk", fake_create_users_bulk)
+    return calls
+
+
+@pytest.fixture
+def client():
+    """Client for the admin router, authenticated as an admin."""
+    app = FastAPI()
+    app.include_router(admin.router, prefix="/admin")
+    app.add_exception_handler(TayAIError, tayai_exception_handler)
+    
+    async def no_db():
+        yield None
+    
+    app.dependency_overrides[get_db] = no_db
+    app.dependency_overrides[get_current_admin] = lambda: {"user_id": 1, "is_admin": True}
+    return TestClient(app)
+
+
+def _payload(count: int, **extra) -> dict:
+    return {
+        "users": [
+            {"email": f"user{i}@example.com", "username": f"user{i}", "password": "password123"}
+            for i in range(count)
+        ],
+        **extra,
+    }
+
+
+class TestBulkCreateUsers:
+    """POST /admin/users/bulk"""
+    
+    def test_creates_users_in_input_order(self, client, bulk_calls):
+        response = client.post("/admin/users/bulk", json=_payload(3))
+        
+        assert response.status_code == 200
+        assert [u["username"] for u in response.json()] == ["user0", "user1", "user2"]
+        assert "password" not in response.json()[0]
+        assert bulk_calls[0]["tier"] == UserTier.BASIC
+        assert bulk_calls[0]["users"][0] == {
+            "email": "user0@example.com",
+            "username": "user0",
+            "password": "password123",
+        }
+    
+    def test_passes_requested_tier(self, client, bulk_calls):
+        response = client.post("/admin/users/bulk", json=_payload(1, tier="vip"))
+        
+        assert response.status_code == 200
+        assert response.json()[0]["tier"] == "vip"
+        assert bulk_calls[0]["tier"] == UserTier.VIP
+    
+    def test_rejects_unknown_tier(self, client, bulk_calls):
+        response = client.post("/admin/users/bulk", json=_payload(1, tier="gold"))
+        
+        assert response.status_code == 400
+        assert bulk_calls == []
+    
+    def test_rejects_empty_batch(self, client, bulk_calls):
+        response = client.post("/admin/users/bulk", json={"users": []})
+        
+        assert response.status_code == 422
+        assert bulk_calls == []
+    
+    def test_rejects_oversized_batch(self, client, bulk_calls):
+        response = client.post("/admin/users/bulk", json=_payload(501))
+        
+        assert response.status_code == 422
+        assert bulk_calls == []
+    
+    def test_existing_user_is_a_conflict(self, client, monkeypatch):
+        async def taken(self, users, tier=UserTier.BASIC, start_trial=True):
+            raise AlreadyExistsError("User", "email", users[0]["email"])
+        
+        monkeypatch.setattr(UserService, "create_users_bulk", taken)
+        
+        response = client.post("/admin/users/bulk", json=_payload(2))
+        
+        assert response.status_code == 409
+        assert response.json()["error"] == "ALREADY_EXISTS"
@@ -0,0 +1,114 @@
+"""
+Membership Service Tests
+
+Webhook signature verification and product-to-tier resolution.
+"""
+import hashlib
+import hmac
+
+import pytest
+
+from app.core.config import settings
+from app.db.models import UserTier
+from app.services.membership_service import MembershipPlatform, MembershipService
+
+SECRET = "webhook-secret"
+PAYLOAD = b'{"event": "subscription.created"}'
+
+
+def _sign(payload: bytes, secret: str = SECRET) -> str:
+    return hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Custom-platform service with a webhook secret configured."""
+    monkeypatch.setattr(settings, "MEMBERSHIP_PLATFORM_API_KEY", SECRET)
+    return MembershipService()
+
+
+class TestVerifyWebhookSignature:
+    """MembershipService.verify_webhook_signature"""
+    
+    def test_valid_signature(self, service):
+        assert service.verify_webhook_signature(PAYLOAD, _sign(PAYLOAD))
+    
+    def test_sha256_prefix_is_accepted(self, service):
+        assert service.verify_webhook_signature(PAYLOAD, "sha256=" + _sign(PAYLOAD))
+    
+    def test_modified_payload_is_rejected(self, service):
+        assert not service.verify_webhook_signature(PAYLOAD + b" ", _sign(PAYLOAD))
+    
+    def test_wrong_secret_is_rejected(self, service):
+        assert not service.verify_webhook_signature(PAYLOAD, _sign(PAYLOAD, "other-secret"))
+    
+    @pytest.mark.parametrize("signature", [
+        "",
+        "sha256=",
+        "abc123",
+        "z" * 64,
+        "0" * 63,
+        "0" * 65,
+    ])
+    def test_malformed_signature_is_rejected(self, service, signature):
+        assert not service.verify_webhook_signature(PAYLOAD, signature)
+    
+    def test_uppercase_hex_is_rejected(self, service):
+        assert not service.verify_webhook_signature(PAYLOAD, _sign(PAYLOAD).upper())
+    
+    def test_repeated_verification_uses_fresh_hmac(self, service):
+        # The keyed HMAC is shared between calls and must not accumulate input
+        for _ in range(3):
+            assert service.verify_webhook_signature(PAYLOAD, _sign(PAYLOAD))
+    
+    def test_services_with_different_secrets_do_not_share_keys(self, service, monkeypatch):
+        monkeypatch.setattr(settings, "MEMBERSHIP_PLATFORM_API_KEY", "other-secret")
+        other = MembershipService()
+        
+        assert other.verify_webhook_signature(PAYLOAD, _sign(PAYLOAD, "other-secret"))
+        assert service.verify_webhook_signature(PAYLOAD, _sign(PAYLOAD))
+    
+    def test_skool_uses_skool_secret(self, monkeypatch):
+        monkeypatch.setattr(settings, "MEMBERSHIP_PLATFORM_API_KEY", "generic-secret")
+        monkeypatch.setattr(settings, "SKOOL_WEBHOOK_SECRET", SECRET)
+        service = MembershipService(MembershipPlatform.SKOOL)
+        
+        assert service.verify_webhook_signature(PAYLOAD, _sign(PAYLOAD))
+        assert not service.verify_webhook_signature(PAYLOAD, _sign(PAYLOAD, "generic-secret"))
+    
+    def test_no_secret_allows_all(self, monkeypatch):
+        monkeypatch.setattr(settings, "MEMBERSHIP_PLATFORM_API_KEY", "")
+        
+        assert MembershipService().verify_webhook_signature(PAYLOAD, "anything")
+
+
+class TestResolveTier:
+    """MembershipService.resolve_tier"""
+    
+    @pytest.mark.parametrize("product_id, tier", [
+        ("basic", UserTier.BASIC),
+        ("TRIAL", UserTier.BASIC),
+        ("vip", UserTier.VIP),
+        ("Elite", UserTier.VIP),
+    ])
+    def test_exact_match_ignores_case(self, product_id, tier):
+        assert MembershipService().resolve_tier(product_id) == tier
+    
+    @pytest.mark.parametrize("product_id, tier", [
+        ("basic_monthly", UserTier.BASIC),
+        ("annual-vip-plan", UserTier.VIP),
+        ("free trial", UserTier.BASIC),
+    ])
+    def test_partial_match(self, product_id, tier):
+        assert MembershipService().resolve_tier(product_id) == tier
+    
+    @pytest.mark.parametrize("product_id, tier", [
+        ("hair_hustlers_co", UserTier.BASIC),
+        ("Hair_Hustlers_Elite", UserTier.VIP),
+        ("community", UserTier.BASIC),
+    ])
+    def test_skool_products(self, product_id, tier):
+        assert MembershipService(MembershipPlatform.SKOOL).resolve_tier(product_id) == tier
+    
+    def test_unknown_product_defaults_to_basic(self):
+        assert MembershipService().resolve_tier("gift_card") == UserTier.BASIC
@@ -0,0 +1,41 @@
+"""
+Query Helper Tests
+
+Keyset pagination cursors.
+"""
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.query_helpers import decode_cursor, encode_cursor
+
+
+class TestCursor:
+    """encode_cursor / decode_cursor"""
+    
+    @pytest.mark.parametrize("created_at", [
+        datetime(2026, 1, 2, 3, 4, 5),
+        datetime(2026, 1, 2, 3, 4, 5, 123456),
+        datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=-5))),
+    ])
+    def test_round_trip(self, created_at):
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+    
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(datetime(2026, 1, 2, 3, 4, 5, 999999, tzinfo=timezone.utc), 10 ** 12)
+        
+        assert all(c.isalnum() or c in "-_=" for c in cursor)
+    
+    @pytest.mark.parametrize("cursor", [
+        "",
+        "not base64!",
+        base64.urlsafe_b64encode(b"2026-01-02T03:04:05").decode(),
+        base64.urlsafe_b64encode(b"yesterday|1").decode(),
+        base64.urlsafe_b64encode(b"2026-01-02T03:04:05|abc").decode(),
+        base64.urlsafe_b64encode(b"\xff\xfe|1").decode(),
+    ])
+    def test_malformed_cursor_raises_value_error(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
@@ -0,0 +1,278 @@
+"""
+RAG Service Tests
+
+Chunking and HNSW scan settings run without a database. Filtered
+nearest-neighbour searches run against a real PostgreSQL + pgvector
+database through the application's engine; set TEST_DATABASE_URL to run them.
+"""
+import os
+import random
+
+import pytest
+from sqlalchemy import text
+
+from app.core.constants import HNSW_EF_SEARCH, HNSW_EF_SEARCH_MAX
+from app.db.database import AsyncSessionLocal, engine, init_db
+from app.services import rag_service
+from app.services.rag_service import ChunkConfig, RAGService
+
+DIMENSION = 1536
+TOP_K = 5
+
+
+# =============================================================================
+# Chunking
+# =============================================================================
+
+class TestSplitByParagraphs:
+    """RAGService._split_by_paragraphs"""
+    
+    @staticmethod
+    def split(content: str, chunk_size: int = 50) -> list:
+        return RAGService(chunk_config=ChunkConfig(chunk_size=chunk_size))._split_by_paragraphs(content)
+    
+    def test_empty_content_has_no_chunks(self):
+        assert self.split("") == []
+        assert self.split("\n\n  \n\n") == []
+    
+    def test_small_paragraphs_are_combined(self):
+        assert self.split("First one.\n\nSecond one.") == ["First one.\n\nSecond one."]
+    
+    def test_paragraphs_are_stripped_and_blank_ones_skipped(self):
+        assert self.split("  First.  \n\n\n\n   \n\n Second. ") == ["First.\n\nSecond."]
+    
+    def test_new_chunk_when_next_paragraph_does_not_fit(self):
+        first = "a" * 30
+        second = "b" * 30
+        
+        assert self.split(f"{first}\n\n{second}") == [first, second]
+    
+    def test_separator_counts_towards_chunk_size(self):
+        # 24 + 2 + 24 == 50 fits exactly; one more character does not
+        assert self.split(f"{'a' * 24}\n\n{'b' * 24}") == [f"{'a' * 24}\n\n{'b' * 24}"]
+        assert len(self.split(f"{'a' * 24}\n\n{'b' * 25}")) == 2
+    
+    def test_large_paragraph_is_split_by_sentences(self):
+        sentences = [f"Sentence number {i} is here." for i in range(6)]
+        chunks = self.split(" ".join(sentences))
+        
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 50 for chunk in chunks)
+        assert " ".join(chunks) == " ".join(sentences)
+    
+    def test_large_paragraph_starts_a_new_chunk(self):
+        long_paragraph = " ".join(f"Sentence number {i} is here." for i in range(6))
+        chunks = self.split(f"Intro.\n\n{long_paragraph}")
+        
+        assert chunks[0] == "Intro."
+
+
+# =============================================================================
+# HNSW scan settings
+# =============================================================================
+
+class RecordingSession:
+    """Records executed SQL; answers the pgvector version query."""
+    
+    def __init__(self, version: str = "0.8.0"):
+        self.version = version
+        self.executed = []
+    
+    async def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        version = self.version
+        
+        class Result:
+            def scalar(self):
+                return version
+        
+        return Result()
+
+
+def _params(top_k: int = TOP_K, namespace=None, metadata_filter=None, candidates=None) -> dict:
+    params = {"top_k": top_k, "namespace": namespace, "metadata_filter": metadata_filter}
+    if candidates is not None:
+        params["candidates"] = candidates
+    return params
+
+
+class TestPrepareHnswScan:
+    """RAGService._prepare_hnsw_scan"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_version_check(self, monkeypatch):
+        monkeypatch.setattr(rag_service, "_iterative_scan_supported", None)
+    
+    async def test_small_unfiltered_query_keeps_defaults(self):
+        db = RecordingSession()
+        
+        await RAGService(db)._prepare_hnsw_scan(_params())
+        
+        assert db.executed == []
+    
+    async def test_large_top_k_raises_ef_search(self):
+        db = RecordingSession()
+        
+        await RAGService(db)._prepare_hnsw_scan(_params(top_k=100))
+        
+        sql, params = db.executed[-1]
+        assert "hnsw.ef_search" in sql and "iterative_scan" not in sql
+        assert params == {"ef_search": "100"}
+    
+    async def test_ef_search_is_capped(self):
+        db = RecordingSession()
+        
+        await RAGService(db)._prepare_hnsw_scan(_params(top_k=200, candidates=2000))
+        
+        assert db.executed[-1][1] == {"ef_search": str(HNSW_EF_SEARCH_MAX)}
+    
+    @pytest.mark.parametrize("filters", [
+        {"namespace": "kb"},
+        {"metadata_filter": '{"category": "hair"}'},
+    ])
+    async def test_filtered_query_uses_iterative_scan(self, filters):
+        db = RecordingSession(version="0.8.0")
+        
+        await RAGService(db)._prepare_hnsw_scan(_params(**filters))
+        
+        sql, params = db.executed[-1]
+        assert "relaxed_order" in sql
+        assert params == {"ef_search": str(HNSW_EF_SEARCH)}
+    
+    async def test_filtered_query_without_iterative_scan_widens_ef_search(self):
+        db = RecordingSession(version="0.7.4")
+        
+        await RAGService(db)._prepare_hnsw_scan(_params(namespace="kb"))
+        
+        sql, params = db.executed[-1]
+        assert "iterative_scan" not in sql
+        assert params == {"ef_search": str(HNSW_EF_SEARCH_MAX)}
+    
+    async def test_version_is_checked_once(self):
+        db = RecordingSession(version="0.8.1")
+        service = RAGService(db)
+        
+        await service._prepare_hnsw_scan(_params(namespace="kb"))
+        await service._prepare_hnsw_scan(_params(namespace="kb"))
+        
+        assert sum("pg_extension" in sql for sql, _ in db.executed) == 1
+
+
+# =============================================================================
+# Filtered search (PostgreSQL + pgvector)
+# =============================================================================
+
+def _unit_vector(weights: dict, rng: random.Random) -> list:
+    """Vector with the given component weights plus a little noise, scaled to unit length."""
+    vector = [rng.uniform(-0.01, 0.01) for _ in range(DIMENSION)]
+    for index, weight in weights.items():
+        vector[index] += weight
+    norm = sum(x * x for x in vector) ** 0.5
+    return [x / norm for x in vector]
+
+
+@pytest.fixture
+async def db():
+    """Session on a transaction holding a temporary, HNSW-indexed vector_embeddings."""
+    # The application's startup path: creates the vector extension and
+    # resets the pool so new connections register the pgvector codecs
+    await init_db()
+    
+    async with AsyncSessionLocal() as session:
+        # Shadows the real table for this transaction only
+        await session.execute(text(f"""
+            CREATE TEMP TABLE vector_embeddings (
+                id VARCHAR PRIMARY KEY,
+                embedding halfvec({DIMENSION}) NOT NULL,
+                content TEXT NOT NULL,
+                metadata JSONB,
+                namespace VARCHAR
+            ) ON COMMIT DROP
+        """))
+        
+        # Many unfiltered rows sit right next to the query; the few rows
+        # that match the filters are further away
+        rng = random.Random(0)
+        rows = [
+            {
+                "id": f"other_{i}",
+                "embedding": _unit_vector({0: 1.0}, rng),
+                "content": "other",
+                "metadata": '{"category": "other"}',
+                "namespace": "other",
+            }
+            for i in range(500)
+        ] + [
+            {
+                "id": f"target_{i}",
+                "embedding": _unit_vector({0: 1.0, 1 + i: 1.0}, rng),
+                "content": "target",
+                "metadata": '{"category": "target"}',
+                "namespace": "target",
+            }
+            for i in range(20)
+        ]
+        await session.execute(
+            text(
+                "INSERT INTO vector_embeddings (id, embedding, content, metadata, namespace) "
+                "VALUES (:id, CAST(:embedding AS halfvec), :content, "
+                "CAST(:metadata AS jsonb), :namespace)"
+            ),
+            rows
+        )
+        await session.execute(text(
+            "CREATE INDEX ON vector_embeddings USING hnsw (embedding halfvec_ip_ops)"
+        ))
+        await session.execute(text("ANALYZE vector_embeddings"))
+        # Make the planner use the HNSW index, as it would on a large table
+        await session.execute(text("SET LOCAL enable_seqscan = off"))
+        
+        yield session
+        
+        await session.rollback()
+    # Pooled connections belong to this test's event loop
+    await engine.dispose()
+
+
+@pytest.fixture
+def rag_service_with_db(db, monkeypatch):
+    """RAGService whose query embedding is fixed instead of calling OpenAI."""
+    service = RAGService(db)
+    query_vector = _unit_vector({0: 1.0}, random.Random(1))
+    
+    async def fake_embedding(query: str):
+        return query_vector
+    
+    monkeypatch.setattr(service, "_generate_embedding", fake_embedding)
+    return service
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not os.getenv("TEST_DATABASE_URL"), reason="TEST_DATABASE_URL not set")
+class TestFilteredSearch:
+    """Filters applied after the HNSW index must still fill top_k."""
+    
+    async def test_unfiltered_search_returns_top_k(self, rag_service_with_db):
+        results = await rag_service_with_db.search_similar("query", top_k=TOP_K)
+        
+        assert len(results) == TOP_K
+    
+    async def test_namespace_filter_returns_top_k(self, rag_service_with_db):
+        results = await rag_service_with_db.search_similar("query", top_k=TOP_K, namespace="target")
+        
+        assert len(results) == TOP_K
+        assert all(r["id"].startswith("target_") for r in results)
+    
+    async def test_metadata_filter_returns_top_k(self, rag_service_with_db):
+        results = await rag_service_with_db.search_similar(
+            "query", top_k=TOP_K, filter_metadata={"category": "target"}
+        )
+        
+        assert len(results) == TOP_K
+        assert all(r["metadata"]["category"] == "target" for r in results)
+    
+    async def test_filtered_results_are_ordered_by_similarity(self, rag_service_with_db):
+        results = await rag_service_with_db.search_similar("query", top_k=TOP_K, namespace="target")
+        
+        scores = [r["score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
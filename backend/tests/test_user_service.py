@@ -0,0 +1,166 @@
+"""
+User Service Tests
+
+UserService logic that runs without a database: a fake session records the
+statements and plays back canned results.
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.core.constants import PASSWORD_HASH_MAX_CONCURRENCY
+from app.core.exceptions import AlreadyExistsError, ValidationError
+from app.db.models import UserTier
+from app.services import user_service
+from app.services.user_service import UserService
+
+
+class FakeResult:
+    """Enough of a SQLAlchemy Result for the bulk create path."""
+    
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+    
+    def all(self):
+        return list(self._rows)
+    
+    def scalars(self):
+        return self
+
+
+class FakeSession:
+    """Session that returns (or raises) queued outcomes for each execute()."""
+    
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+    
+    async def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    async def commit(self):
+        self.commits += 1
+    
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def _users(count: int) -> list:
+    return [
+        {"email": f"User{i}@Example.com", "username": f"user{i}", "password": "password123"}
+        for i in range(count)
+    ]
+
+
+def _created(users: list) -> FakeResult:
+    return FakeResult(
+        SimpleNamespace(id=i + 1, email=u["email"], username=u["username"])
+        for i, u in enumerate(users)
+    )
+
+
+@pytest.fixture(autouse=True)
+def fast_hash(monkeypatch):
+    """Replace bcrypt with a cheap hash."""
+    monkeypatch.setattr(user_service, "get_password_hash", lambda password: f"hashed:{password}")
+
+
+class TestCreateUsersBulk:
+    """UserService.create_users_bulk"""
+    
+    async def test_inserts_all_users_in_one_statement(self):
+        users = _users(3)
+        db = FakeSession(FakeResult(), _created(users))
+        
+        created = await UserService(db).create_users_bulk(users)
+        
+        assert [u.username for u in created] == ["user0", "user1", "user2"]
+        assert len(db.statements) == 2
+        _, params = db.statements[1]
+        assert [p["hashed_password"] for p in params] == ["hashed:password123"] * 3
+        assert db.commits == 1
+    
+    async def test_trial_dates_come_from_the_database_clock(self):
+        users = _users(2)
+        db = FakeSession(FakeResult(), _created(users))
+        
+        await UserService(db).create_users_bulk(users)
+        
+        statement, params = db.statements[1]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "trial_start_date" in sql and "now()" in sql
+        assert all("trial_start_date" not in p for p in params)
+    
+    async def test_no_trial_dates_without_trial(self):
+        users = _users(1)
+        db = FakeSession(FakeResult(), _created(users))
+        
+        await UserService(db).create_users_bulk(users, tier=UserTier.VIP)
+        
+        statement, _ = db.statements[1]
+        assert "now()" not in str(statement.compile(dialect=postgresql.dialect()))
+    
+    async def test_rejects_emails_repeated_in_batch_ignoring_case(self):
+        users = _users(2)
+        users[1]["email"] = users[0]["email"].upper()
+        db = FakeSession()
+        
+        with pytest.raises(ValidationError):
+            await UserService(db).create_users_bulk(users)
+        assert db.statements == []
+    
+    async def test_existing_username_is_reported(self):
+        users = _users(2)
+        db = FakeSession(FakeResult([SimpleNamespace(username="user1", email="other@example.com")]))
+        
+        with pytest.raises(AlreadyExistsError) as exc_info:
+            await UserService(db).create_users_bulk(users)
+        assert exc_info.value.details["field"] == "username"
+        assert len(db.statements) == 1
+    
+    async def test_concurrent_insert_becomes_already_exists(self):
+        users = _users(2)
+        db = FakeSession(
+            FakeResult(),
+            IntegrityError("INSERT INTO users", {}, Exception("duplicate key")),
+            FakeResult([SimpleNamespace(username="someone", email="user0@example.com")]),
+        )
+        
+        with pytest.raises(AlreadyExistsError) as exc_info:
+            await UserService(db).create_users_bulk(users)
+        assert exc_info.value.details["field"] == "email"
+        assert db.rollbacks == 1
+        assert db.commits == 0
+    
+    async def test_hashing_concurrency_is_bounded(self, monkeypatch):
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+        
+        def slow_hash(password):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return f"hashed:{password}"
+        
+        monkeypatch.setattr(user_service, "get_password_hash", slow_hash)
+        users = _users(PASSWORD_HASH_MAX_CONCURRENCY * 4)
+        db = FakeSession(FakeResult(), _created(users))
+        
+        await UserService(db).create_users_bulk(users)
+        
+        assert 1 <= peak <= PASSWORD_HASH_MAX_CONCURRENCY